@@ -0,0 +1,83 @@
+"""On-disk parquet cache for dashboard query results"""
+import os
+import glob
+import hashlib
+import tempfile
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Project-local cache so results survive Streamlit restarts and redeploys;
+# set DASHBOARD_CACHE_DIR to keep it outside the source tree
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "dashboard"
+)
+
+def run_query(client, query, bqstorage_client=None):
+    """Run a single query and return the results as an Arrow table"""
+    # Reuse the caller's Storage API client instead of opening a new one per query
+    return client.query(query).result().to_arrow(bqstorage_client=bqstorage_client)
+
+def cached_query(client, table_id, query, bqstorage_client=None, cache_path=None, name=None):
+    """Return query results from disk unless the source table changed since they were cached
+    
+    Results cached under the same name replace each other, so a query whose text changes over
+    time (e.g. a rolling date filter) keeps one file rather than one per version of the SQL.
+    """
+    cache_path = cache_path or os.getenv('DASHBOARD_CACHE_DIR', CACHE_PATH)
+    key = hashlib.sha1(query.encode()).hexdigest()
+    prefix = f"{name}_{key}" if name else key
+    
+    # Table metadata lookup is far cheaper than re-running the query
+    modified = int(client.get_table(table_id).modified.timestamp())
+    path = os.path.join(cache_path, f"{prefix}_{modified}.parquet")
+    
+    if os.path.exists(path):
+        return pq.read_table(path)
+    
+    table = run_query(client, query, bqstorage_client)
+    
+    # Write to a temp file of our own first so concurrent writers of the same query
+    # (prefetch threads, other sessions) never read or move a partial parquet
+    os.makedirs(cache_path, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_path, prefix=f"{key}_", suffix=".tmp", delete=False) as tmp_file:
+        tmp_path = tmp_file.name
+    try:
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    
+    # Drop results cached against older versions of the table, or of the named query - another writer may get there first
+    for stale_path in glob.glob(os.path.join(cache_path, f"{name or key}_*.parquet")):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass
+    
+    return table
+
+def table_digest(table):
+    """Content hash of an Arrow table for st.cache_data keys - hashes the column buffers instead of pickling"""
+    digest = hashlib.sha1(str(table.schema).encode())
+    for column in table.columns:
+        for chunk in column.chunks:
+            # Slices share their parent's buffers, so the window into them is part of the content
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    return digest.hexdigest()
+
+def table_to_ipc(table):
+    """Serialize an Arrow table to IPC stream bytes, so each st.cache_data hit copies one flat buffer
+    and reopens it zero-copy instead of rebuilding the table's column arrays"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def table_from_ipc(buffer):
+    """Read an Arrow table back from IPC stream bytes without copying the column data"""
+    return pa.ipc.open_stream(buffer).read_all()
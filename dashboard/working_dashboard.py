@@ -1,12 +1,19 @@
 import streamlit as st
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
-import plotly.graph_objects as go
 import os
 import sys
-import json
-import tempfile
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
+from google.cloud.exceptions import NotFound
+from google.oauth2 import service_account
+import google.auth
+from google.auth.credentials import with_scopes_if_required
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # Load environment variables for local development
@@ -16,6 +23,113 @@ load_dotenv()
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
+from dashboard._cache import cached_query, table_digest, table_to_ipc, table_from_ipc
+
+DATASET_ID = "customer_behavior"
+
+# Columns each query fetches - kept in step with the columns the show_* pages read,
+# since BigQuery bills and transfers every column a SELECT * touches
+TOUCHPOINTS = ['website', 'mobile_app', 'email', 'social_media', 'store_visit', 'customer_service']
+TOUCHPOINT_ANALYSIS_COLUMNS = ['touchpoint', 'total_revenue', 'total_interactions', 'unique_customers', 'conversion_rate']
+SEGMENT_SUMMARY_COLUMNS = [
+    'customer_segment', 'customer_count', 'avg_revenue', 'avg_interactions',
+    'total_revenue', 'total_interactions', 'active_customers'
+]
+# Per-touchpoint count columns - fixed by the schema, so they are never rediscovered per render
+TOUCHPOINT_TREND_COLUMNS = tuple(f'daily_{touchpoint}_interactions' for touchpoint in TOUCHPOINTS)
+TIME_SERIES_COLUMNS = ['date', 'daily_revenue', 'daily_interactions', *TOUCHPOINT_TREND_COLUMNS]
+JOURNEY_SUMMARY_COLUMNS = ['first_touchpoint', 'last_touchpoint', 'journey_count', 'avg_revenue', 'avg_duration']
+TOP_JOURNEY_PATH_COLUMNS = ['journey_path', 'journey_count']
+
+# Dashboard queries by name: (source table, used to invalidate the on-disk result cache; columns; SQL template).
+# Segment and journey rollups are materialized by BigQueryManager.refresh_materializations
+DASHBOARD_QUERIES = {
+    'touchpoint_analysis': ('touchpoint_analysis', TOUCHPOINT_ANALYSIS_COLUMNS, """
+    SELECT {columns} FROM `{table_id}`
+    """),
+    'customer_segments_summary': ('dashboard_segment_summary', SEGMENT_SUMMARY_COLUMNS, """
+    SELECT {columns} FROM `{table_id}`
+    ORDER BY avg_revenue DESC
+    """),
+    'time_series_data': ('time_series_data', TIME_SERIES_COLUMNS, """
+    SELECT {columns} FROM `{table_id}`
+    {date_filter}
+    """),
+    'journey_summary': ('dashboard_journey_summary', JOURNEY_SUMMARY_COLUMNS, """
+    SELECT {columns} FROM `{table_id}`
+    ORDER BY journey_count DESC
+    LIMIT 10
+    """),
+    # APPROX_TOP_COUNT aggregates in a single pass, so only ten rows leave BigQuery
+    'top_journey_paths': ('customer_journeys', TOP_JOURNEY_PATH_COLUMNS, """
+    SELECT item.value AS journey_path, item.count AS journey_count
+    FROM UNNEST((
+        SELECT APPROX_TOP_COUNT(journey_path, 10)
+        FROM `{table_id}`
+    )) AS item
+    """)
+}
+
+# Live aggregates over each rollup's source table, by query name: (source table, SQL template).
+# Used when the materialized rollup is missing or older than its source, e.g. on a dataset
+# loaded before the rollups existed or written to outside upload_all_processed_data
+LIVE_ROLLUP_QUERIES = {
+    'customer_segments_summary': ('customer_segments', """
+    SELECT {columns} FROM (
+        SELECT 
+            customer_segment,
+            COUNT(*) as customer_count,
+            AVG(total_revenue) as avg_revenue,
+            AVG(total_interactions) as avg_interactions,
+            SUM(total_revenue) as total_revenue,
+            SUM(total_interactions) as total_interactions,
+            COUNT(total_revenue) as active_customers
+        FROM `{table_id}`
+        GROUP BY customer_segment
+    )
+    ORDER BY avg_revenue DESC
+    """),
+    'journey_summary': ('customer_journeys', """
+    SELECT {columns} FROM (
+        SELECT 
+            first_touchpoint,
+            last_touchpoint,
+            COUNT(*) as journey_count,
+            AVG(total_revenue) as avg_revenue,
+            AVG(journey_duration_days) as avg_duration
+        FROM `{table_id}`
+        GROUP BY first_touchpoint, last_touchpoint
+    )
+    ORDER BY journey_count DESC
+    LIMIT 10
+    """)
+}
+
+# Trend window choices in days (None = full history) - filtered in BigQuery so only those days are transferred
+TIME_WINDOWS = {
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "Last 365 days": 365,
+    "All time": None
+}
+DEFAULT_WINDOW_DAYS = 90
+
+# Tables refreshed on a short TTL - everything else is a summary rebuilt only on upload
+DYNAMIC_TABLES = {'time_series_data'}
+
+# Tables each page renders from - only these are fetched before the page is drawn
+PAGE_TABLES = {
+    "Overview": ['touchpoint_analysis', 'customer_segments_summary'],
+    "Touchpoint Analysis": ['touchpoint_analysis'],
+    "Customer Segments": ['customer_segments_summary'],
+    "Journey Analysis": ['journey_summary', 'top_journey_paths'],
+    "Time Trends": ['time_series_data'],
+    "🤖 AI Insights": []
+}
+
+# Connections kept open to BigQuery - the cached client is shared by every session's concurrent queries
+QUERY_POOL_SIZE = 16
+
 st.set_page_config(
     page_title="Customer Behavior Analytics",
     page_icon="📊",
@@ -24,19 +138,18 @@ st.set_page_config(
 )
 
 def get_credentials():
-    """Get credentials from Streamlit secrets or environment"""
+    """Get credentials from Streamlit secrets or environment, built in memory"""
     try:
         if hasattr(st, 'secrets') and 'GOOGLE_APPLICATION_CREDENTIALS' in st.secrets:
             # Running in Streamlit Cloud
             credentials_dict = dict(st.secrets["GOOGLE_APPLICATION_CREDENTIALS"])
-            
-            # Create temporary file for credentials
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(credentials_dict, f)
-                return f.name
+            return service_account.Credentials.from_service_account_info(credentials_dict)
         else:
-            # Running locally
-            return os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service-account-key.json')
+            # Running locally - fall back to application default credentials if there is no key file
+            credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service-account-key.json')
+            if os.path.exists(credentials_path):
+                return service_account.Credentials.from_service_account_file(credentials_path)
+            return None
     except Exception as e:
         st.error(f"Error loading credentials: {e}")
         return None
@@ -49,14 +162,14 @@ def get_config():
             return {
                 'project_id': st.secrets.get("GCP_PROJECT_ID"),
                 'dataset_id': st.secrets.get("BQ_DATASET_ID", "customer_behavior"),
-                'credentials_path': get_credentials()
+                'credentials': get_credentials()
             }
         else:
             # Running locally
             return {
                 'project_id': os.getenv('GCP_PROJECT_ID'),
                 'dataset_id': os.getenv('BQ_DATASET_ID', 'customer_behavior'),
-                'credentials_path': os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service-account-key.json')
+                'credentials': get_credentials()
             }
     except Exception as e:
         st.error(f"Error loading configuration: {e}")
@@ -71,110 +184,183 @@ def get_bigquery_client():
             raise Exception("Configuration not loaded")
         
         project_id = config['project_id']
-        credentials_path = config['credentials_path']
         
         if not project_id:
             raise Exception("GCP_PROJECT_ID not found in configuration")
         
-        if credentials_path:
-            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+        # Credentials are passed in memory - nothing is written to disk or the environment
+        credentials = config['credentials']
+        if credentials is None:
+            credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+        else:
+            credentials = with_scopes_if_required(credentials, bigquery.Client.SCOPE)
         
-        client = bigquery.Client(project=project_id)
+        # Our own authorized session with a wider pool, so concurrent queries don't queue for a connection
+        session = AuthorizedSession(credentials)
+        session.mount('https://', HTTPAdapter(pool_connections=QUERY_POOL_SIZE, pool_maxsize=QUERY_POOL_SIZE))
+        client = bigquery.Client(project=project_id, credentials=credentials, _http=session)
         
-        # Test the connection
-        try:
-            list(client.list_datasets(max_results=1))
-            st.success(f"✅ Connected to BigQuery project: {project_id}")
-        except Exception as e:
-            st.error(f"❌ BigQuery connection test failed: {e}")
-            return None, None
+        # One Storage Read API client shared by every query - results stream as Arrow instead of REST JSON pages
+        bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
         
-        return client, project_id
+        # No separate connection test - a bad connection surfaces through the first query's error handling
+        return client, bqstorage_client, project_id
     except Exception as e:
         st.error(f"Error initializing BigQuery client: {e}")
-        return None, None
+        return None, None, None
+
+def summarize_overview(segments_summary):
+    """Roll the per-segment totals up into the overview KPI tiles"""
+    # Reduce the Arrow columns directly - no pandas conversion needed for a few sums
+    total_revenue = pc.sum(segments_summary['total_revenue']).as_py() or 0.0
+    active_customers = pc.sum(segments_summary['active_customers']).as_py() or 0
+    
+    # AVG() in SQL skips customers without revenue, so divide by those that have it
+    return pa.table({
+        'total_customers': [int(pc.sum(segments_summary['customer_count']).as_py() or 0)],
+        'total_revenue': [float(total_revenue)],
+        'total_interactions': [int(pc.sum(segments_summary['total_interactions']).as_py() or 0)],
+        'avg_customer_value': [float(total_revenue / active_customers) if active_customers else 0.0]
+    })
 
-@st.cache_data
-def load_data_from_bigquery():
-    """Load data from BigQuery with caching - using cache_data for data"""
+def rollup_is_current(client, project_id, rollup_table, source_table):
+    """Check that a materialized rollup exists and was rebuilt after its source table last changed"""
     try:
-        client, project_id = get_bigquery_client()
-        if not client or not project_id:
-            raise Exception("BigQuery client not initialized")
-        
-        dataset_id = "customer_behavior"
-        
-        # Define queries
-        queries = {
-            'touchpoint_analysis': f"""
-            SELECT * FROM `{project_id}.{dataset_id}.touchpoint_analysis`
-            """,
-            'customer_segments_summary': f"""
-            SELECT 
-                customer_segment,
-                COUNT(*) as customer_count,
-                AVG(total_revenue) as avg_revenue,
-                AVG(total_interactions) as avg_interactions
-            FROM `{project_id}.{dataset_id}.customer_segments`
-            GROUP BY customer_segment
-            ORDER BY avg_revenue DESC
-            """,
-            'time_series_data': f"""
-            SELECT * FROM `{project_id}.{dataset_id}.time_series_data`
-            ORDER BY date
-            """,
-            'journey_summary': f"""
-            SELECT 
-                first_touchpoint,
-                last_touchpoint,
-                COUNT(*) as journey_count,
-                AVG(total_revenue) as avg_revenue,
-                AVG(journey_duration_days) as avg_duration
-            FROM `{project_id}.{dataset_id}.customer_journeys`
-            GROUP BY first_touchpoint, last_touchpoint
-            ORDER BY journey_count DESC
-            LIMIT 10
-            """,
-            'overview_metrics': f"""
-            SELECT 
-                COUNT(DISTINCT customer_id) as total_customers,
-                SUM(total_revenue) as total_revenue,
-                SUM(total_interactions) as total_interactions,
-                AVG(total_revenue) as avg_customer_value
-            FROM `{project_id}.{dataset_id}.customer_segments`
-            """
-        }
-        
-        data = {}
-        for name, query in queries.items():
-            try:
-                st.info(f"Loading {name}...")
-                result = client.query(query)
-                data[name] = result.to_dataframe()
-                st.success(f"✅ Loaded {name}: {len(data[name])} rows")
-            except Exception as e:
-                st.warning(f"⚠️ Error loading {name}: {e}")
-                data[name] = pd.DataFrame()
-        
-        if all(df.empty for df in data.values()):
-            st.error("❌ No data loaded from any table")
-            return {}
-        
-        return data
-    except Exception as e:
-        st.error(f"❌ Error loading data from BigQuery: {e}")
-        return {}
+        rollup = client.get_table(f"{project_id}.{DATASET_ID}.{rollup_table}")
+    except NotFound:
+        return False
+    source = client.get_table(f"{project_id}.{DATASET_ID}.{source_table}")
+    return rollup.modified >= source.modified
+
+def fetch_table(name, client, bqstorage_client, project_id, window_days=None):
+    """Fetch one dashboard table through the on-disk cache - results stay Arrow tables until a chart needs pandas"""
+    source_table, columns, query = DASHBOARD_QUERIES[name]
+    if name in LIVE_ROLLUP_QUERIES:
+        live_source_table, live_query = LIVE_ROLLUP_QUERIES[name]
+        if not rollup_is_current(client, project_id, source_table, live_source_table):
+            source_table, query = live_source_table, live_query
+    table_id = f"{project_id}.{DATASET_ID}.{source_table}"
+    
+    # The start date is fixed here rather than with CURRENT_DATE() so cached results roll over daily
+    date_filter = ""
+    if window_days:
+        date_filter = f"WHERE date >= DATE '{date.today() - timedelta(days=window_days)}'"
+    # Named per window, so the file for yesterday's start date is replaced rather than left behind
+    table = cached_query(
+        client, table_id, query.format(columns=', '.join(columns), table_id=table_id, date_filter=date_filter),
+        bqstorage_client=bqstorage_client, name=f"{name}_{window_days}" if window_days else None
+    )
+    
+    # Sorted here rather than with ORDER BY, which would pin the Storage API read to a single stream
+    if name == 'time_series_data' and table.num_rows > 0:
+        table = table.sort_by('date')
+    return table
+
+# Summary tables are rebuilt with each upload, while the time series is the one expected to move.
+# Once a TTL lapses the refetch is usually just a table-metadata check against the on-disk cache.
+# The clients are excluded from the cache keys and no Streamlit calls are made, so these are safe off the script thread.
+# st.cache_data hands back a fresh copy on every hit, so tables are cached as Arrow IPC bytes - one flat copy, reopened zero-copy
+@st.cache_data(ttl=timedelta(days=1), show_spinner=False, max_entries=len(DASHBOARD_QUERIES))
+def load_static_table(name, _client, _bqstorage_client, project_id):
+    """Load a summary table that only changes when the warehouse is reloaded"""
+    return table_to_ipc(fetch_table(name, _client, _bqstorage_client, project_id))
+
+@st.cache_data(ttl=timedelta(minutes=5), show_spinner=False, max_entries=len(TIME_WINDOWS))
+def load_dynamic_table(name, _client, _bqstorage_client, project_id, window_days):
+    """Load a table that may change between uploads"""
+    return table_to_ipc(fetch_table(name, _client, _bqstorage_client, project_id, window_days))
+
+def load_table(name, client, bqstorage_client, project_id, window_days=DEFAULT_WINDOW_DAYS):
+    """Load a dashboard table through whichever cache matches how often it changes"""
+    if name in DYNAMIC_TABLES:
+        return table_from_ipc(load_dynamic_table(name, client, bqstorage_client, project_id, window_days))
+    return table_from_ipc(load_static_table(name, client, bqstorage_client, project_id))
+
+@st.cache_data(ttl=timedelta(days=1), show_spinner=False)
+def load_overview_metrics(_client, _bqstorage_client, project_id):
+    """Compute the overview KPIs once per data load rather than on every render"""
+    return summarize_overview(load_table('customer_segments_summary', _client, _bqstorage_client, project_id))
+
+def load_page_data(page, window_days=DEFAULT_WINDOW_DAYS):
+    """Load only the tables the selected page renders, running their queries concurrently"""
+    client, bqstorage_client, project_id = get_bigquery_client()
+    if not client or not project_id:
+        raise Exception("BigQuery client not initialized")
+    
+    names = PAGE_TABLES[page]
+    data = {}
+    if names:
+        # Total latency is the slowest query, not the sum
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(load_table, name, client, bqstorage_client, project_id, window_days) for name in names}
+            
+            # Streamlit calls must stay on the script thread, so report results here
+            for name, future in futures.items():
+                try:
+                    data[name] = future.result()
+                    st.success(f"✅ Loaded {name}: {data[name].num_rows} rows")
+                except Exception as e:
+                    st.warning(f"⚠️ Error loading {name}: {e}")
+                    data[name] = pa.table({})
+    
+    if page == "Overview" and data['customer_segments_summary'].num_rows > 0:
+        data['overview_metrics'] = load_overview_metrics(client, bqstorage_client, project_id)
+    
+    # Warm the remaining tables in the background so switching pages doesn't wait on BigQuery.
+    # Once per session - after that every rerun would only re-read warm cache entries
+    remaining = [name for name in DASHBOARD_QUERIES if name not in names]
+    if remaining and not st.session_state.get('tables_prefetched'):
+        st.session_state.tables_prefetched = True
+        prefetch_executor = ThreadPoolExecutor(max_workers=len(remaining))
+        for name in remaining:
+            prefetch_executor.submit(load_table, name, client, bqstorage_client, project_id, window_days)
+        prefetch_executor.shutdown(wait=False)
+    
+    return data
+
+# Figures are cached on the content of their source table, so reruns and page switches
+# reuse the built figure instead of running Plotly Express again
+@st.cache_data(hash_funcs={pa.Table: table_digest}, show_spinner=False)
+def build_figure(kind, table, **kwargs):
+    """Build a Plotly Express figure of the given kind from an Arrow table"""
+    return getattr(px, kind)(table.to_pandas(date_as_object=False), **kwargs)
+
+@st.cache_data(hash_funcs={pa.Table: table_digest}, show_spinner=False)
+def build_touchpoint_trends_figure(time_series):
+    """Build the per-touchpoint daily interactions chart, or None if the table has no touchpoint columns"""
+    # BigQuery DATE arrives as Arrow date32 - convert straight to datetime64 instead of re-parsing
+    time_data = time_series.to_pandas(date_as_object=False)
+    touchpoint_cols = [col for col in TOUCHPOINT_TREND_COLUMNS if col in time_data.columns]
+    if not touchpoint_cols:
+        return None
+    
+    # One long-format frame lets Plotly build every touchpoint line in a single pass
+    touchpoint_trends = time_data.melt(
+        id_vars='date',
+        value_vars=touchpoint_cols,
+        var_name='touchpoint',
+        value_name='interactions'
+    )
+    touchpoint_trends['touchpoint'] = (
+        touchpoint_trends['touchpoint'].str.removeprefix('daily_').str.removesuffix('_interactions')
+    )
+    
+    return px.line(
+        touchpoint_trends,
+        x='date',
+        y='interactions',
+        color='touchpoint',
+        title="Daily Interactions by Touchpoint",
+        render_mode='webgl'
+    )
 
 # Load AI insights system
 @st.cache_resource
 def load_ai_insights():
-    """Load AI insights system - using cache_resource for AI system objects"""
-    try:
-        from rag_system.local_insights_ai import LocalCustomerInsightsAI
-        return LocalCustomerInsightsAI()
-    except Exception as e:
-        st.warning(f"⚠️ AI insights not available: {e}")
-        return None
+    """Load AI insights system - using cache_resource for AI system objects.
+    Runs off the script thread, so failures are reported by the caller"""
+    from rag_system.local_insights_ai import LocalCustomerInsightsAI
+    return LocalCustomerInsightsAI()
 
 def show_ai_insights(ai_system):
     """Show AI-powered insights"""
@@ -235,11 +421,37 @@ def main():
     st.title("🎯 Customer Behavior Analytics Dashboard")
     st.markdown("---")
     
-    # Load data
+    # Start the AI system in the background so it initializes while BigQuery data loads.
+    # Once per session - later reruns reuse the finished future instead of a new thread,
+    # unless initialization failed, which is retried as it was before
+    previous_future = st.session_state.get('ai_future')
+    if previous_future is None or (previous_future.done() and previous_future.exception() is not None):
+        ai_executor = ThreadPoolExecutor(max_workers=1)
+        st.session_state.ai_future = ai_executor.submit(load_ai_insights)
+        ai_executor.shutdown(wait=False)
+    ai_future = st.session_state.ai_future
+    
+    # Sidebar for navigation
+    st.sidebar.title("📋 Navigation")
+    page = st.sidebar.selectbox(
+        "Choose a view:",
+        list(PAGE_TABLES)
+    )
+    
+    window_days = DEFAULT_WINDOW_DAYS
+    if page == "Time Trends":
+        window_label = st.sidebar.selectbox(
+            "Time window:",
+            list(TIME_WINDOWS),
+            index=list(TIME_WINDOWS.values()).index(DEFAULT_WINDOW_DAYS)
+        )
+        window_days = TIME_WINDOWS[window_label]
+    
+    # Load only the data this page needs
     with st.spinner("Loading data from BigQuery..."):
         try:
-            data = load_data_from_bigquery()
-            if data and any(not df.empty for df in data.values()):
+            data = load_page_data(page, window_days)
+            if not PAGE_TABLES[page] or any(table.num_rows > 0 for table in data.values()):
                 st.success("✅ Data loaded successfully!")
             else:
                 st.error("❌ No data loaded - check your BigQuery connection and data")
@@ -252,20 +464,12 @@ def main():
     # Load AI system
     with st.spinner("🤖 Initializing AI insights..."):
         try:
-            ai_system = load_ai_insights()
-            if ai_system:
-                st.success("🧠 AI insights ready!")
+            ai_system = ai_future.result()
+            st.success("🧠 AI insights ready!")
         except Exception as e:
             st.warning(f"⚠️ AI system not available: {e}")
             ai_system = None
     
-    # Sidebar for navigation
-    st.sidebar.title("📋 Navigation")
-    page = st.sidebar.selectbox(
-        "Choose a view:",
-        ["Overview", "Touchpoint Analysis", "Customer Segments", "Journey Analysis", "Time Trends", "🤖 AI Insights"]
-    )
-    
     if page == "Overview":
         show_overview(data)
     elif page == "Touchpoint Analysis":
@@ -283,19 +487,19 @@ def show_overview(data):
     st.header("📈 Overview Dashboard")
     
     # Key metrics
-    if 'overview_metrics' in data and not data['overview_metrics'].empty:
-        metrics = data['overview_metrics'].iloc[0]
+    if 'overview_metrics' in data:
+        metrics = data['overview_metrics'].to_pylist()[0]
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Customers", f"{int(metrics['total_customers']):,}")
+            st.metric("Total Customers", f"{metrics['total_customers']:,}")
         
         with col2:
             st.metric("Total Revenue", f"${metrics['total_revenue']:,.2f}")
         
         with col3:
-            st.metric("Total Interactions", f"{int(metrics['total_interactions']):,}")
+            st.metric("Total Interactions", f"{metrics['total_interactions']:,}")
         
         with col4:
             st.metric("Avg Customer Value", f"${metrics['avg_customer_value']:.2f}")
@@ -306,9 +510,10 @@ def show_overview(data):
     col1, col2 = st.columns(2)
     
     with col1:
-        if 'touchpoint_analysis' in data and not data['touchpoint_analysis'].empty:
+        if 'touchpoint_analysis' in data and data['touchpoint_analysis'].num_rows > 0:
             st.subheader("Revenue by Touchpoint")
-            fig = px.bar(
+            fig = build_figure(
+                'bar',
                 data['touchpoint_analysis'],
                 x='touchpoint',
                 y='total_revenue',
@@ -321,9 +526,10 @@ def show_overview(data):
             st.warning("⚠️ Touchpoint analysis data not available")
     
     with col2:
-        if 'customer_segments_summary' in data and not data['customer_segments_summary'].empty:
+        if 'customer_segments_summary' in data and data['customer_segments_summary'].num_rows > 0:
             st.subheader("Customer Segment Distribution")
-            fig = px.pie(
+            fig = build_figure(
+                'pie',
                 data['customer_segments_summary'],
                 values='customer_count',
                 names='customer_segment',
@@ -336,20 +542,19 @@ def show_overview(data):
 def show_touchpoint_analysis(data):
     st.header("🎯 Touchpoint Performance Analysis")
     
-    if 'touchpoint_analysis' in data and not data['touchpoint_analysis'].empty:
-        touchpoint_data = data['touchpoint_analysis']
-        
-        # Metrics table
+    if 'touchpoint_analysis' in data and data['touchpoint_analysis'].num_rows > 0:
+        # st.dataframe renders Arrow tables directly; only the charts need pandas
         st.subheader("Touchpoint Metrics")
-        st.dataframe(touchpoint_data, use_container_width=True)
+        st.dataframe(data['touchpoint_analysis'], use_container_width=True)
         
         # Visualizations
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Conversion Rate by Touchpoint")
-            fig = px.bar(
-                touchpoint_data,
+            fig = build_figure(
+                'bar',
+                data['touchpoint_analysis'],
                 x='touchpoint',
                 y='conversion_rate',
                 title="Conversion Rate (%)",
@@ -360,8 +565,9 @@ def show_touchpoint_analysis(data):
         
         with col2:
             st.subheader("Revenue vs Interactions")
-            fig = px.scatter(
-                touchpoint_data,
+            fig = build_figure(
+                'scatter',
+                data['touchpoint_analysis'],
                 x='total_interactions',
                 y='total_revenue',
                 size='unique_customers',
@@ -375,20 +581,19 @@ def show_touchpoint_analysis(data):
 def show_customer_segments(data):
     st.header("👥 Customer Segmentation Analysis")
     
-    if 'customer_segments_summary' in data and not data['customer_segments_summary'].empty:
-        segments_data = data['customer_segments_summary']
-        
+    if 'customer_segments_summary' in data and data['customer_segments_summary'].num_rows > 0:
         # Display the data
         st.subheader("Segment Performance")
-        st.dataframe(segments_data, use_container_width=True)
+        st.dataframe(data['customer_segments_summary'], use_container_width=True)
         
         # Visualizations
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Average Revenue by Segment")
-            fig = px.bar(
-                segments_data,
+            fig = build_figure(
+                'bar',
+                data['customer_segments_summary'],
                 x='customer_segment',
                 y='avg_revenue',
                 title="Average Revenue by Customer Segment",
@@ -399,8 +604,9 @@ def show_customer_segments(data):
         
         with col2:
             st.subheader("Customer Count by Segment")
-            fig = px.bar(
-                segments_data,
+            fig = build_figure(
+                'bar',
+                data['customer_segments_summary'],
                 x='customer_segment',
                 y='customer_count',
                 title="Number of Customers by Segment",
@@ -414,16 +620,15 @@ def show_customer_segments(data):
 def show_journey_analysis(data):
     st.header("🛤️ Customer Journey Analysis")
     
-    if 'journey_summary' in data and not data['journey_summary'].empty:
-        journey_data = data['journey_summary']
-        
+    if 'journey_summary' in data and data['journey_summary'].num_rows > 0:
         st.subheader("Top Journey Paths")
-        st.dataframe(journey_data, use_container_width=True)
+        st.dataframe(data['journey_summary'], use_container_width=True)
         
         # Visualization
         st.subheader("Journey Performance")
-        fig = px.scatter(
-            journey_data,
+        fig = build_figure(
+            'scatter',
+            data['journey_summary'],
             x='avg_duration',
             y='avg_revenue',
             size='journey_count',
@@ -433,22 +638,32 @@ def show_journey_analysis(data):
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.warning("⚠️ Journey analysis data not available")
+    
+    if 'top_journey_paths' in data and data['top_journey_paths'].num_rows > 0:
+        st.subheader("Most Common Journey Paths")
+        fig = build_figure(
+            'bar',
+            data['top_journey_paths'],
+            x='journey_count',
+            y='journey_path',
+            orientation='h',
+            title="Top 10 Journey Paths"
+        )
+        st.plotly_chart(fig, use_container_width=True)
 
 def show_time_trends(data):
     st.header("📅 Time Series Analysis")
     
-    if 'time_series_data' in data and not data['time_series_data'].empty:
-        time_data = data['time_series_data']
-        time_data['date'] = pd.to_datetime(time_data['date'])
-        
+    if 'time_series_data' in data and data['time_series_data'].num_rows > 0:
         # Time series charts
         st.subheader("Daily Trends")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.line(
-                time_data,
+            fig = build_figure(
+                'line',
+                data['time_series_data'],
                 x='date',
                 y='daily_revenue',
                 title="Daily Revenue Trend"
@@ -456,8 +671,9 @@ def show_time_trends(data):
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            fig = px.line(
-                time_data,
+            fig = build_figure(
+                'line',
+                data['time_series_data'],
                 x='date',
                 y='daily_interactions',
                 title="Daily Interactions Trend"
@@ -466,20 +682,9 @@ def show_time_trends(data):
         
         # Touchpoint trends
         st.subheader("Touchpoint Trends Over Time")
-        touchpoint_cols = [col for col in time_data.columns if col.startswith('daily_') and col.endswith('_interactions')]
+        fig = build_touchpoint_trends_figure(data['time_series_data'])
         
-        if touchpoint_cols:
-            fig = go.Figure()
-            for col in touchpoint_cols:
-                touchpoint_name = col.replace('daily_', '').replace('_interactions', '')
-                fig.add_trace(go.Scatter(
-                    x=time_data['date'],
-                    y=time_data[col],
-                    mode='lines',
-                    name=touchpoint_name
-                ))
-            
-            fig.update_layout(title="Daily Interactions by Touchpoint")
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("💡 Touchpoint trend data not available")
@@ -1,18 +1,44 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from faker import Faker
-import random
 from datetime import datetime, timedelta
 import json
 import os
-from typing import List, Dict, Any
+from typing import Dict, Any
+
+# Arrow types for the date/time columns, so the CSVs keep plain dates and microsecond timestamps
+# (Arrow would otherwise write registration_date with a midnight time and timestamps to the nanosecond)
+CSV_COLUMN_TYPES = {
+    'registration_date': pa.date32(),
+    'timestamp': pa.timestamp('us')
+}
+
+def to_csv_table(df: pd.DataFrame) -> pa.Table:
+    """Convert a DataFrame to an Arrow table with the CSV column types applied"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name, arrow_type in CSV_COLUMN_TYPES.items():
+        if name in table.column_names:
+            table = table.set_column(table.schema.get_field_index(name), name, table[name].cast(arrow_type))
+    return table
 
 class CustomerBehaviorSimulator:
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", seed: int = None):
+        # Every draw goes through one generator, so a seed reproduces the whole dataset
+        self.rng = np.random.default_rng(seed)
         self.fake = Faker()
+        if seed is not None:
+            self.fake.seed_instance(seed)
         self.config = self._load_config(config_path)
-        self.customers = []
-        self.interactions = []
+        
+        # Touchpoint sampling table, built once: a uniform draw's position in the cumulative weights picks the touchpoint
+        self.touchpoints = np.array(self.config['data_collection']['simulation']['touchpoints'])
+        self.touchpoint_cum_weights = np.cumsum(list(self.config['touchpoint_weights'].values()))
+        self.touchpoint_cum_weights[-1] = 1.0  # Guard against weights summing to slightly under 1
+        
+        self.customers = pd.DataFrame()
+        self.interactions = pd.DataFrame()
         
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file"""
@@ -41,73 +67,93 @@ class CustomerBehaviorSimulator:
                 }
             }
     
-    def generate_customers(self) -> List[Dict]:
+    def generate_customers(self) -> pd.DataFrame:
         """Generate synthetic customer profiles"""
-        customers = []
         num_customers = self.config['data_collection']['simulation']['num_customers']
+        rng = self.rng
         
-        for i in range(num_customers):
-            customer = {
-                'customer_id': f"CUST_{i+1:06d}",
-                'first_name': self.fake.first_name(),
-                'last_name': self.fake.last_name(),
-                'email': self.fake.email(),
-                'phone': self.fake.phone_number(),
-                'age': random.randint(18, 75),
-                'gender': random.choice(['M', 'F', 'Other']),
-                'city': self.fake.city(),
-                'state': self.fake.state(),
-                'country': self.fake.country(),
-                'registration_date': self.fake.date_between(start_date='-2y', end_date='today'),
-                'customer_segment': random.choice(['Premium', 'Standard', 'Basic']),
-                'preferred_channel': random.choice(['website', 'mobile_app', 'store']),
-                'lifetime_value': round(random.uniform(100, 5000), 2)
-            }
-            customers.append(customer)
+        # Numeric and categorical columns are drawn for every customer at once
+        customer_ids = np.char.add('CUST_', np.char.zfill(np.arange(1, num_customers + 1).astype(str), 6))
+        registration_days_ago = rng.integers(0, 731, num_customers).astype('timedelta64[D]')
+        
+        # Faker is slow per call, so draw from small pools of its values instead of calling it per customer
+        first_names = rng.choice([self.fake.first_name() for _ in range(500)], num_customers)
+        last_names = rng.choice([self.fake.last_name() for _ in range(500)], num_customers)
+        cities = rng.choice([self.fake.city() for _ in range(200)], num_customers)
+        states = rng.choice([self.fake.state() for _ in range(50)], num_customers)
+        countries = rng.choice([self.fake.country() for _ in range(50)], num_customers)
+        
+        # Emails and phone numbers are assembled with vectorized string ops; the row number keeps emails unique
+        email_users = np.char.add(np.char.add(np.char.lower(first_names), '.'), np.char.lower(last_names))
+        email_users = np.char.add(email_users, np.arange(1, num_customers + 1).astype(str))
+        emails = np.char.add(email_users, rng.choice(['@example.com', '@example.net', '@example.org'], num_customers))
+        phones = np.char.add(
+            np.char.add(rng.integers(200, 1000, num_customers).astype(str), '-'),
+            np.char.add(
+                np.char.add(rng.integers(200, 1000, num_customers).astype(str), '-'),
+                np.char.zfill(rng.integers(0, 10000, num_customers).astype(str), 4)
+            )
+        )
+        
+        customers = pd.DataFrame({
+            'customer_id': customer_ids,
+            'first_name': first_names,
+            'last_name': last_names,
+            'email': emails,
+            'phone': phones,
+            'age': rng.integers(18, 76, num_customers),
+            'gender': rng.choice(['M', 'F', 'Other'], num_customers),
+            'city': cities,
+            'state': states,
+            'country': countries,
+            'registration_date': np.datetime64('today', 'D') - registration_days_ago,
+            'customer_segment': rng.choice(['Premium', 'Standard', 'Basic'], num_customers),
+            'preferred_channel': rng.choice(['website', 'mobile_app', 'store'], num_customers),
+            'lifetime_value': np.round(rng.uniform(100, 5000, num_customers), 2)
+        })
         
         self.customers = customers
         return customers
     
-    def generate_interactions(self) -> List[Dict]:
+    def generate_interactions(self) -> pd.DataFrame:
         """Generate customer interactions across touchpoints"""
-        if not self.customers:
+        if self.customers.empty:
             self.generate_customers()
             
-        interactions = []
-        touchpoints = self.config['data_collection']['simulation']['touchpoints']
-        weights = list(self.config['touchpoint_weights'].values())
         days_to_simulate = self.config['data_collection']['simulation']['days_to_simulate']
+        rng = self.rng
         
         start_date = datetime.now() - timedelta(days=days_to_simulate)
         
-        for customer in self.customers:
-            # Each customer has 1-20 interactions over the period
-            num_interactions = random.randint(1, 20)
-            
-            for _ in range(num_interactions):
-                touchpoint = np.random.choice(touchpoints, p=weights)
-                interaction_date = start_date + timedelta(
-                    days=random.randint(0, days_to_simulate),
-                    hours=random.randint(0, 23),
-                    minutes=random.randint(0, 59)
-                )
-                
-                interaction = {
-                    'interaction_id': f"INT_{len(interactions)+1:08d}",
-                    'customer_id': customer['customer_id'],
-                    'touchpoint': touchpoint,
-                    'timestamp': interaction_date.isoformat(),
-                    'session_duration_minutes': random.randint(1, 120),
-                    'pages_viewed': random.randint(1, 15) if touchpoint in ['website', 'mobile_app'] else None,
-                    'action_taken': random.choice(['view', 'click', 'purchase', 'download', 'subscribe', 'contact']),
-                    'product_category': random.choice(['Electronics', 'Clothing', 'Books', 'Home', 'Sports', 'Beauty']),
-                    'revenue': round(random.uniform(0, 500), 2) if random.random() < 0.3 else 0,
-                    'device_type': random.choice(['Desktop', 'Mobile', 'Tablet']) if touchpoint in ['website', 'mobile_app'] else None,
-                    'referrer_source': random.choice(['organic', 'paid_search', 'social', 'email', 'direct']) if touchpoint == 'website' else None,
-                    'campaign_id': f"CAMP_{random.randint(1, 50):03d}" if random.random() < 0.4 else None
-                }
-                
-                interactions.append(interaction)
+        # Each customer has 1-20 interactions over the period, drawn for all customers at once
+        interactions_per_customer = rng.integers(1, 21, len(self.customers))
+        customer_ids = np.repeat(self.customers['customer_id'].to_numpy(), interactions_per_customer)
+        total = len(customer_ids)
+        
+        touchpoint = self.touchpoints[np.searchsorted(self.touchpoint_cum_weights, rng.random(total), side='right')]
+        # Fields that only apply to digital touchpoints are left empty for the others
+        is_digital = np.isin(touchpoint, ['website', 'mobile_app'])
+        is_website = touchpoint == 'website'
+        has_revenue = rng.random(total) < 0.3
+        has_campaign = rng.random(total) < 0.4
+        
+        # A random day, hour and minute in the period is a uniform draw over its minutes
+        minutes_offset = rng.integers(0, (days_to_simulate + 1) * 24 * 60, total)
+        
+        interactions = pd.DataFrame({
+            'interaction_id': np.char.add('INT_', np.char.zfill(np.arange(1, total + 1).astype(str), 8)),
+            'customer_id': customer_ids,
+            'touchpoint': touchpoint,
+            'timestamp': pd.Timestamp(start_date) + pd.to_timedelta(minutes_offset, unit='m'),
+            'session_duration_minutes': rng.integers(1, 121, total),
+            'pages_viewed': pd.Series(rng.integers(1, 16, total), dtype='Int64').where(is_digital),
+            'action_taken': rng.choice(['view', 'click', 'purchase', 'download', 'subscribe', 'contact'], total),
+            'product_category': rng.choice(['Electronics', 'Clothing', 'Books', 'Home', 'Sports', 'Beauty'], total),
+            'revenue': np.where(has_revenue, np.round(rng.uniform(0, 500, total), 2), 0.0),
+            'device_type': pd.Series(rng.choice(['Desktop', 'Mobile', 'Tablet'], total)).where(is_digital),
+            'referrer_source': pd.Series(rng.choice(['organic', 'paid_search', 'social', 'email', 'direct'], total)).where(is_website),
+            'campaign_id': pd.Series(np.char.add('CAMP_', np.char.zfill(rng.integers(1, 51, total).astype(str), 3))).where(has_campaign)
+        })
         
         self.interactions = interactions
         return interactions
@@ -117,13 +163,13 @@ class CustomerBehaviorSimulator:
         output_path = self.config['data_collection']['output_path']
         os.makedirs(output_path, exist_ok=True)
         
-        # Save customers
+        # Save customers - Arrow's CSV writer formats columns in C++ rather than cell by cell
         customers_df = pd.DataFrame(self.customers)
-        customers_df.to_csv(f"{output_path}/customers.csv", index=False)
+        pacsv.write_csv(to_csv_table(customers_df), f"{output_path}/customers.csv")
         
         # Save interactions
         interactions_df = pd.DataFrame(self.interactions)
-        interactions_df.to_csv(f"{output_path}/interactions.csv", index=False)
+        pacsv.write_csv(to_csv_table(interactions_df), f"{output_path}/interactions.csv")
         
         print(f"Data saved to {output_path}")
         print(f"Generated {len(self.customers)} customers and {len(self.interactions)} interactions")
@@ -1,32 +1,79 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import os
 
+# Day-precision dates stay columnar and are written as plain YYYY-MM-DD, which BigQuery DATE columns expect
+DATE_DTYPE = pd.ArrowDtype(pa.date32())
+
+# Target types for the raw interactions CSV, so parsing and type conversion happen in one pass
+INTERACTION_COLUMN_TYPES = {
+    'interaction_id': pa.string(),
+    'customer_id': pa.string(),
+    'touchpoint': pa.string(),
+    'timestamp': pa.timestamp('ns'),
+    'session_duration_minutes': pa.int32(),
+    'pages_viewed': pa.int32(),
+    'action_taken': pa.string(),
+    'product_category': pa.string(),
+    'revenue': pa.float64(),
+    'device_type': pa.string(),
+    'referrer_source': pa.string(),
+    'campaign_id': pa.string()
+}
+
+# Customer columns parsed as dates while the CSV is read, rather than converted afterwards
+CUSTOMER_DATE_COLUMNS = ['registration_date']
+
+# Compact dtypes applied once cleaning is done - ranges come from the simulator
+INTERACTION_NARROW_TYPES = {
+    'session_duration_minutes': 'int16',
+    'pages_viewed': 'int8',
+    'touchpoint': 'category',
+    'action_taken': 'category',
+    'product_category': 'category',
+    'device_type': 'category',
+    'referrer_source': 'category'
+}
+CUSTOMER_NARROW_TYPES = {
+    'age': 'int8',
+    'gender': 'category',
+    'customer_segment': 'category',
+    'preferred_channel': 'category'
+}
+
 class DataCleaner:
     def __init__(self, raw_data_path="data/raw/", processed_data_path="data/processed/"):
         self.raw_data_path = raw_data_path
         self.processed_data_path = processed_data_path
     
-    def clean_interactions_data(self):
-        """Clean interactions data for BigQuery compatibility"""
-        interactions_path = os.path.join(self.raw_data_path, "interactions.csv")
-        interactions_df = pd.read_csv(interactions_path)
+    def clean_interactions_data(self, interactions_df: pd.DataFrame = None):
+        """Clean interactions data for BigQuery compatibility.
+        Pass the simulator's DataFrame to skip re-reading the CSV it just wrote"""
+        if interactions_df is None:
+            interactions_path = os.path.join(self.raw_data_path, "interactions.csv")
+            # Arrow parses the file on multiple threads straight into the target types
+            convert_options = pacsv.ConvertOptions(column_types=INTERACTION_COLUMN_TYPES, strings_can_be_null=True)
+            interactions_df = pacsv.read_csv(interactions_path, convert_options=convert_options).to_pandas()
+        else:
+            # Leave the caller's frame untouched
+            interactions_df = interactions_df.copy()
         
         print(f"Original interactions shape: {interactions_df.shape}")
         
-        # Convert decimal columns to integers (handle NaN values)
+        # Fill missing integers (columns arrive typed, so no string parsing is needed)
         integer_columns = ['session_duration_minutes', 'pages_viewed']
         for col in integer_columns:
             if col in interactions_df.columns:
-                # Convert to numeric first, then to int (handling NaN)
-                interactions_df[col] = pd.to_numeric(interactions_df[col], errors='coerce')
                 interactions_df[col] = interactions_df[col].fillna(0).astype(int)
         
-        # Convert revenue to float (ensure proper decimal handling)
-        interactions_df['revenue'] = pd.to_numeric(interactions_df['revenue'], errors='coerce').fillna(0.0)
+        # Fill missing revenue
+        interactions_df['revenue'] = interactions_df['revenue'].fillna(0.0)
         
-        # Convert timestamp to proper datetime format
-        interactions_df['timestamp'] = pd.to_datetime(interactions_df['timestamp'])
+        # Convert timestamp to proper datetime format - BigQuery keeps microsecond precision at most
+        # (it is already datetime64 from the typed read or the simulator's frame, so only the unit changes)
+        interactions_df['timestamp'] = interactions_df['timestamp'].astype('datetime64[us]')
         
         # Handle NULL values for string columns
         string_columns = ['device_type', 'referrer_source', 'campaign_id']
@@ -34,17 +81,29 @@ class DataCleaner:
             if col in interactions_df.columns:
                 interactions_df[col] = interactions_df[col].fillna('')
         
-        # Save cleaned data
-        clean_path = os.path.join(self.raw_data_path, "interactions_clean.csv")
-        interactions_df.to_csv(clean_path, index=False)
+        # Narrow integers to their real ranges and dictionary-encode the short label columns.
+        # Revenue stays float64 - float32 would change cent values once loaded into BigQuery FLOAT
+        interactions_df = interactions_df.astype(INTERACTION_NARROW_TYPES)
+        
+        # Save cleaned data as Parquet - BigQuery batch-loads it without re-parsing text.
+        # Naive timestamps are marked UTC so the file's timestamps load as TIMESTAMP rather than DATETIME
+        clean_path = os.path.join(self.raw_data_path, "interactions_clean.parquet")
+        interactions_df.assign(timestamp=interactions_df['timestamp'].dt.tz_localize('UTC')).to_parquet(
+            clean_path, engine='pyarrow', compression='snappy', index=False
+        )
         print(f"Cleaned interactions saved to: {clean_path}")
         
         return interactions_df
     
-    def clean_customers_data(self):
-        """Clean customers data for BigQuery compatibility"""
-        customers_path = os.path.join(self.raw_data_path, "customers.csv")
-        customers_df = pd.read_csv(customers_path)
+    def clean_customers_data(self, customers_df: pd.DataFrame = None):
+        """Clean customers data for BigQuery compatibility.
+        Pass the simulator's DataFrame to skip re-reading the CSV it just wrote"""
+        if customers_df is None:
+            customers_path = os.path.join(self.raw_data_path, "customers.csv")
+            customers_df = pd.read_csv(customers_path, parse_dates=CUSTOMER_DATE_COLUMNS, date_format='ISO8601')
+        else:
+            # Leave the caller's frame untouched
+            customers_df = customers_df.copy()
         
         print(f"Original customers shape: {customers_df.shape}")
         
@@ -54,8 +113,8 @@ class DataCleaner:
         # Convert lifetime_value to float
         customers_df['lifetime_value'] = pd.to_numeric(customers_df['lifetime_value'], errors='coerce').fillna(0.0)
         
-        # Convert registration_date to proper date format
-        customers_df['registration_date'] = pd.to_datetime(customers_df['registration_date']).dt.date
+        # Convert registration_date to a columnar date32 rather than Python date objects
+        customers_df['registration_date'] = customers_df['registration_date'].astype(DATE_DTYPE)
         
         # Handle NULL values for string columns
         string_columns = ['phone', 'city', 'state', 'country']
@@ -63,9 +122,12 @@ class DataCleaner:
             if col in customers_df.columns:
                 customers_df[col] = customers_df[col].fillna('')
         
-        # Save cleaned data
-        clean_path = os.path.join(self.raw_data_path, "customers_clean.csv")
-        customers_df.to_csv(clean_path, index=False)
+        # Narrow age and dictionary-encode the short label columns
+        customers_df = customers_df.astype(CUSTOMER_NARROW_TYPES)
+        
+        # Save cleaned data as Parquet for a batch load into BigQuery
+        clean_path = os.path.join(self.raw_data_path, "customers_clean.parquet")
+        customers_df.to_parquet(clean_path, engine='pyarrow', compression='snappy', index=False)
         print(f"Cleaned customers saved to: {clean_path}")
         
         return customers_df
@@ -73,41 +135,40 @@ class DataCleaner:
     def clean_all_processed_data(self):
         """Clean all processed data files"""
         processed_files = [
-            'customer_journeys.csv',
-            'touchpoint_analysis.csv', 
-            'customer_segments.csv',
-            'time_series_data.csv'
+            'customer_journeys.parquet',
+            'touchpoint_analysis.parquet', 
+            'customer_segments.parquet',
+            'time_series_data.parquet'
         ]
         
         for filename in processed_files:
             filepath = os.path.join(self.processed_data_path, filename)
             if os.path.exists(filepath):
                 print(f"Cleaning {filename}...")
-                df = pd.read_csv(filepath)
+                df = pd.read_parquet(filepath)
                 
-                # Convert all numeric columns properly
-                for col in df.columns:
-                    if df[col].dtype == 'object':
-                        # Try to convert to numeric if it looks like a number
-                        try:
-                            numeric_series = pd.to_numeric(df[col], errors='coerce')
-                            if not numeric_series.isna().all():
-                                # If conversion worked for most values, use it
-                                if numeric_series.notna().sum() > len(df) * 0.8:
-                                    df[col] = numeric_series.fillna(0)
-                                    # Convert to int if all values are whole numbers
-                                    if (df[col] % 1 == 0).all():
-                                        df[col] = df[col].astype(int)
-                        except:
-                            pass
+                # Convert numeric-looking text columns - Parquet already keeps the numeric ones typed
+                for col in df.select_dtypes(include='object').columns:
+                    # errors='coerce' turns non-numbers into NaN rather than raising
+                    numeric_series = pd.to_numeric(df[col], errors='coerce')
+                    
+                    # Only convert if it worked for most values
+                    if numeric_series.notna().sum() <= len(df) * 0.8:
+                        continue
+                    
+                    numeric_series = numeric_series.fillna(0)
+                    # Convert to int if all values are whole numbers
+                    if numeric_series.mod(1).eq(0).all():
+                        numeric_series = numeric_series.astype(int)
+                    df[col] = numeric_series
                 
-                # Handle date columns
+                # Handle date columns - Parquet usually hands them back as date32 already, making this a no-op
                 if 'date' in df.columns:
-                    df['date'] = pd.to_datetime(df['date']).dt.date
+                    df['date'] = df['date'].astype(DATE_DTYPE)
                 
                 # Save cleaned file
-                clean_path = os.path.join(self.processed_data_path, f"{filename.replace('.csv', '_clean.csv')}")
-                df.to_csv(clean_path, index=False)
+                clean_path = os.path.join(self.processed_data_path, f"{filename.replace('.parquet', '_clean.parquet')}")
+                df.to_parquet(clean_path, engine='pyarrow', compression='zstd', compression_level=3, index=False)
                 print(f"Cleaned {filename} saved as {clean_path}")
     
     def clean_all_data(self):
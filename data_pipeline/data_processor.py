@@ -1,10 +1,30 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
+# Calendar dates as a columnar Arrow date32 rather than Python date objects
+DATE_DTYPE = pd.ArrowDtype(pa.date32())
+
+# Interaction columns repeated across many rows, kept as pandas categoricals while processing
+INTERACTION_CATEGORICAL_COLUMNS = [
+    'customer_id', 'touchpoint', 'action_taken', 'device_type', 'referrer_source', 'product_category'
+]
+
+# Datasets written by process_all_data, one file each under the processed data path
+PROCESSED_DATASETS = ['customer_journeys', 'touchpoint_analysis', 'customer_segments', 'time_series_data']
+
+# Sidecar file recording which raw inputs the processed datasets were built from
+RAW_DATA_KEY_FILE = ".raw_data_key"
+
+# Bytes of CSV parsed per block when reading the interactions file
+CSV_BLOCK_SIZE = 64 << 20
+
 class CustomerDataProcessor:
     def __init__(self, raw_data_path: str = None, processed_data_path: str = None):
         # Get the project root directory (one level up from data_pipeline)
@@ -35,12 +55,34 @@ class CustomerDataProcessor:
         if not os.path.exists(interactions_path):
             raise FileNotFoundError(f"Interactions data not found at {interactions_path}")
             
-        customers_df = pd.read_csv(customers_path)
-        interactions_df = pd.read_csv(interactions_path)
+        # Parse in parallel with Arrow, converting timestamps on read
+        customers_df = pacsv.read_csv(
+            customers_path,
+            convert_options=pacsv.ConvertOptions(
+                column_types={'registration_date': pa.timestamp('ns')},
+                strings_can_be_null=True
+            )
+        ).to_pandas()
+        # Repeated labels are dictionary-encoded block by block as they are parsed, so the full
+        # column never exists as Python strings; the Arrow buffers are released as pandas takes them
+        interactions_df = pacsv.read_csv(
+            interactions_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={
+                    'timestamp': pa.timestamp('ns'),
+                    **{col: pa.dictionary(pa.int32(), pa.string()) for col in INTERACTION_CATEGORICAL_COLUMNS}
+                },
+                strings_can_be_null=True
+            )
+        ).to_pandas(split_blocks=True, self_destruct=True)
         
-        # Convert timestamp to datetime
-        interactions_df['timestamp'] = pd.to_datetime(interactions_df['timestamp'])
-        customers_df['registration_date'] = pd.to_datetime(customers_df['registration_date'])
+        # Group keys and low-cardinality labels hash once here as integer codes for every later groupby;
+        # categories are sorted so category order matches the plain string order
+        for col in INTERACTION_CATEGORICAL_COLUMNS:
+            interactions_df[col] = interactions_df[col].cat.reorder_categories(
+                interactions_df[col].cat.categories.sort_values()
+            )
         
         return customers_df, interactions_df
     
@@ -50,71 +92,82 @@ class CustomerDataProcessor:
         # Sort interactions by customer and timestamp
         interactions_sorted = interactions_df.sort_values(['customer_id', 'timestamp'])
         
-        # Create journey sequences
-        journey_data = []
+        grouped = interactions_sorted.groupby('customer_id', sort=False, observed=True)
         
-        for customer_id, group in interactions_sorted.groupby('customer_id'):
-            touchpoints = group['touchpoint'].tolist()
-            timestamps = group['timestamp'].tolist()
-            actions = group['action_taken'].tolist()
-            revenues = group['revenue'].tolist()
-            
-            # Create journey path
-            journey_path = ' -> '.join(touchpoints)
-            total_interactions = len(touchpoints)
-            total_revenue = sum(revenues)
-            journey_duration = (timestamps[-1] - timestamps[0]).days if len(timestamps) > 1 else 0
-            
-            # Calculate touchpoint frequencies
-            touchpoint_counts = group['touchpoint'].value_counts().to_dict()
-            
-            journey_data.append({
-                'customer_id': customer_id,
-                'journey_path': journey_path,
-                'total_interactions': total_interactions,
-                'total_revenue': total_revenue,
-                'journey_duration_days': journey_duration,
-                'first_touchpoint': touchpoints[0],
-                'last_touchpoint': touchpoints[-1],
-                'unique_touchpoints': len(set(touchpoints)),
-                'conversion_occurred': total_revenue > 0,
-                'touchpoint_counts': json.dumps(touchpoint_counts)
-            })
-        
-        return pd.DataFrame(journey_data)
+        # Aggregate the per-customer scalars in a single pass
+        journeys = grouped.agg(
+            total_interactions=('touchpoint', 'size'),
+            total_revenue=('revenue', 'sum'),
+            first_touchpoint=('touchpoint', 'first'),
+            last_touchpoint=('touchpoint', 'last'),
+            unique_touchpoints=('touchpoint', 'nunique'),
+            t_first=('timestamp', 'first'),
+            t_last=('timestamp', 'last')
+        )
+        journeys['journey_path'] = grouped['touchpoint'].agg(' -> '.join)
+        journeys['journey_duration_days'] = (journeys['t_last'] - journeys['t_first']).dt.days
+        journeys['conversion_occurred'] = journeys['total_revenue'] > 0
+        
+        # Calculate touchpoint frequencies as JSON, assembled one touchpoint column at a time
+        # instead of building and encoding a dict per customer
+        touchpoint_counts = pd.crosstab(interactions_sorted['customer_id'], interactions_sorted['touchpoint'])
+        fragments = pd.Series('', index=touchpoint_counts.index)
+        for touchpoint, counts in touchpoint_counts.items():
+            fragments += np.where(counts > 0, json.dumps(str(touchpoint)) + ': ' + counts.astype(str) + ', ', '')
+        journeys['touchpoint_counts'] = '{' + fragments.str[:-2] + '}'
+        
+        journeys = journeys.reset_index()
+        return journeys[[
+            'customer_id',
+            'journey_path',
+            'total_interactions',
+            'total_revenue',
+            'journey_duration_days',
+            'first_touchpoint',
+            'last_touchpoint',
+            'unique_touchpoints',
+            'conversion_occurred',
+            'touchpoint_counts'
+        ]]
+    
+    @staticmethod
+    def _count_unique_per_group(group_codes: np.ndarray, n_groups: int, value_codes: np.ndarray) -> np.ndarray:
+        """Count distinct value codes within each group code"""
+        n_values = int(value_codes.max()) + 1 if len(value_codes) else 1
+        pairs = np.unique(group_codes.astype(np.int64) * n_values + value_codes)
+        return np.bincount(pairs // n_values, minlength=n_groups)
     
     def create_touchpoint_analysis(self, interactions_df: pd.DataFrame) -> pd.DataFrame:
         """Analyze touchpoint performance"""
-        touchpoint_stats = interactions_df.groupby('touchpoint').agg({
-            'interaction_id': 'count',
-            'revenue': ['sum', 'mean'],
-            'session_duration_minutes': 'mean',
-            'customer_id': 'nunique'
-        }).round(2)
+        codes, touchpoints = pd.factorize(interactions_df['touchpoint'], sort=True)
+        customer_codes, _ = pd.factorize(interactions_df['customer_id'])
+        revenue = interactions_df['revenue'].to_numpy(dtype=np.float64)
+        n = len(touchpoints)
         
-        # Flatten column names
-        touchpoint_stats.columns = [
-            'total_interactions',
-            'total_revenue',
-            'avg_revenue_per_interaction',
-            'avg_session_duration',
-            'unique_customers'
-        ]
+        total = np.bincount(codes, minlength=n)
+        revenue_sum = np.bincount(codes, weights=revenue, minlength=n)
+        session_sum = np.bincount(codes, weights=interactions_df['session_duration_minutes'].to_numpy(dtype=np.float64), minlength=n)
+        conversions = np.bincount(codes, weights=(revenue > 0).astype(np.float64), minlength=n)
         
-        # Calculate conversion rate
-        conversions = interactions_df[interactions_df['revenue'] > 0].groupby('touchpoint')['interaction_id'].count()
-        touchpoint_stats['conversion_rate'] = (conversions / touchpoint_stats['total_interactions'] * 100).fillna(0).round(2)
+        touchpoint_stats = pd.DataFrame({
+            'touchpoint': touchpoints,
+            'total_interactions': total,
+            'total_revenue': revenue_sum,
+            'avg_revenue_per_interaction': revenue_sum / total,
+            'avg_session_duration': session_sum / total,
+            'unique_customers': self._count_unique_per_group(codes, n, customer_codes),
+            'conversion_rate': conversions / total * 100
+        }).round(2)
         
-        touchpoint_stats = touchpoint_stats.reset_index()
         return touchpoint_stats
     
     def create_customer_segments(self, customers_df: pd.DataFrame, interactions_df: pd.DataFrame) -> pd.DataFrame:
         """Create enhanced customer segments based on behavior"""
         # Aggregate customer behavior
-        customer_behavior = interactions_df.groupby('customer_id').agg({
+        customer_behavior = interactions_df.groupby('customer_id', sort=False, observed=True).agg({
             'interaction_id': 'count',
             'revenue': 'sum',
-            'touchpoint': lambda x: len(set(x)),
+            'touchpoint': 'nunique',
             'session_duration_minutes': 'mean',
             'timestamp': ['min', 'max']
         }).round(2)
@@ -130,7 +183,9 @@ class CustomerDataProcessor:
         ]
         
         # Calculate recency (days since last interaction)
-        customer_behavior['recency_days'] = (datetime.now() - customer_behavior['last_interaction']).dt.days
+        # Floor-divide raw datetime64 values rather than going through a Timedelta Series and .dt.days
+        last_interaction = customer_behavior['last_interaction'].to_numpy()
+        customer_behavior['recency_days'] = (np.datetime64(datetime.now()) - last_interaction) // np.timedelta64(1, 'D')
         
         # Create RFM-like segments
         customer_behavior['frequency_score'] = pd.qcut(customer_behavior['total_interactions'], 3, labels=['Low', 'Medium', 'High'])
@@ -145,64 +200,115 @@ class CustomerDataProcessor:
     
     def create_time_series_data(self, interactions_df: pd.DataFrame) -> pd.DataFrame:
         """Create daily aggregated time series data"""
-        interactions_df['date'] = interactions_df['timestamp'].dt.date
+        days = interactions_df['timestamp'].to_numpy().astype('datetime64[D]')
+        codes, dates = pd.factorize(days, sort=True)
+        tp_codes, touchpoints = pd.factorize(interactions_df['touchpoint'], sort=True)
+        customer_codes, _ = pd.factorize(interactions_df['customer_id'])
+        n = len(dates)
         
-        daily_stats = interactions_df.groupby('date').agg({
-            'interaction_id': 'count',
-            'customer_id': 'nunique',
-            'revenue': 'sum',
-            'session_duration_minutes': 'mean'
+        daily_interactions = np.bincount(codes, minlength=n)
+        daily_stats = pd.DataFrame({
+            'date': pd.Series(dates, dtype=DATE_DTYPE),
+            'daily_interactions': daily_interactions,
+            'daily_unique_customers': self._count_unique_per_group(codes, n, customer_codes),
+            'daily_revenue': np.bincount(codes, weights=interactions_df['revenue'].to_numpy(dtype=np.float64), minlength=n),
+            'avg_session_duration': np.bincount(
+                codes, weights=interactions_df['session_duration_minutes'].to_numpy(dtype=np.float64), minlength=n
+            ) / daily_interactions
         }).round(2)
         
-        daily_stats.columns = [
-            'daily_interactions',
-            'daily_unique_customers',
-            'daily_revenue',
-            'avg_session_duration'
-        ]
-        
         # Add touchpoint breakdown
-        touchpoint_daily = interactions_df.groupby(['date', 'touchpoint'])['interaction_id'].count().unstack(fill_value=0)
-        touchpoint_daily.columns = [f'daily_{col}_interactions' for col in touchpoint_daily.columns]
-        
-        daily_stats = daily_stats.join(touchpoint_daily)
-        daily_stats = daily_stats.reset_index()
+        touchpoint_daily = np.bincount(codes * len(touchpoints) + tp_codes, minlength=n * len(touchpoints))
+        touchpoint_daily = touchpoint_daily.reshape(n, len(touchpoints))
+        for i, touchpoint in enumerate(touchpoints):
+            daily_stats[f'daily_{touchpoint}_interactions'] = touchpoint_daily[:, i]
         
         return daily_stats
     
-    def process_all_data(self) -> Dict[str, pd.DataFrame]:
-        """Run the complete data processing pipeline"""
+    def get_raw_data_key(self) -> str:
+        """Fingerprint the raw inputs by size and modification time, or None if one is missing"""
+        parts = []
+        for file_name in ("customers.csv", "interactions.csv"):
+            path = os.path.join(self.raw_data_path, file_name)
+            if not os.path.exists(path):
+                return None
+            stat = os.stat(path)
+            parts.append(f"{file_name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+    
+    def load_processed_data(self) -> Dict[str, pd.DataFrame]:
+        """Load the processed datasets saved by the last run"""
+        return {
+            name: pd.read_parquet(os.path.join(self.processed_data_path, f"{name}.parquet"))
+            for name in PROCESSED_DATASETS
+        }
+    
+    def process_all_data(self, force: bool = False) -> Dict[str, pd.DataFrame]:
+        """Run the complete data processing pipeline
+        
+        Unless force is set, the previous outputs are returned as-is when the raw files
+        haven't changed since they were written.
+        """
         print("Starting data processing pipeline...")
         
+        # Skip the rebuild when the raw data is exactly what the saved outputs came from
+        raw_data_key = self.get_raw_data_key()
+        key_path = os.path.join(self.processed_data_path, RAW_DATA_KEY_FILE)
+        outputs_exist = all(
+            os.path.exists(os.path.join(self.processed_data_path, f"{name}.parquet")) for name in PROCESSED_DATASETS
+        )
+        if not force and raw_data_key and outputs_exist and os.path.exists(key_path):
+            with open(key_path) as key_file:
+                if key_file.read() == raw_data_key:
+                    print("Raw data unchanged since the last run - reusing processed data")
+                    return self.load_processed_data()
+        
         # Load raw data
         print("1. Loading raw data...")
         customers_df, interactions_df = self.load_raw_data()
         
-        # Create processed datasets
-        print("2. Creating customer journeys...")
-        customer_journeys = self.create_customer_journey(interactions_df)
-        
-        print("3. Analyzing touchpoint performance...")
-        touchpoint_analysis = self.create_touchpoint_analysis(interactions_df)
-        
-        print("4. Creating customer segments...")
-        customer_segments = self.create_customer_segments(customers_df, interactions_df)
-        
-        print("5. Creating time series data...")
-        time_series_data = self.create_time_series_data(interactions_df)
-        
-        # Save processed data
-        processed_datasets = {
-            'customer_journeys': customer_journeys,
-            'touchpoint_analysis': touchpoint_analysis,
-            'customer_segments': customer_segments,
-            'time_series_data': time_series_data
-        }
+        # Create processed datasets - the builders only read the raw frames, so they run side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            print("2. Creating customer journeys...")
+            customer_journeys = executor.submit(self.create_customer_journey, interactions_df)
+            
+            print("3. Analyzing touchpoint performance...")
+            touchpoint_analysis = executor.submit(self.create_touchpoint_analysis, interactions_df)
+            
+            print("4. Creating customer segments...")
+            customer_segments = executor.submit(self.create_customer_segments, customers_df, interactions_df)
+            
+            print("5. Creating time series data...")
+            time_series_data = executor.submit(self.create_time_series_data, interactions_df)
+            
+            processed_datasets = {
+                'customer_journeys': customer_journeys.result(),
+                'touchpoint_analysis': touchpoint_analysis.result(),
+                'customer_segments': customer_segments.result(),
+                'time_series_data': time_series_data.result()
+            }
+            
+            # Save processed data as Parquet - typed columns, no text encoding, and dtypes survive the round trip
+            print("6. Saving processed data...")
+            saves = {
+                name: executor.submit(
+                    df.to_parquet,
+                    f"{self.processed_data_path}/{name}.parquet",
+                    engine='pyarrow',
+                    compression='zstd',
+                    compression_level=3,
+                    index=False
+                )
+                for name, df in processed_datasets.items()
+            }
+            for name, save in saves.items():
+                save.result()
+                print(f"   Saved {name}.parquet ({len(processed_datasets[name])} rows)")
         
-        print("6. Saving processed data...")
-        for name, df in processed_datasets.items():
-            df.to_csv(f"{self.processed_data_path}/{name}.csv", index=False)
-            print(f"   Saved {name}.csv ({len(df)} rows)")
+        # Record which raw data these outputs came from, only once every file is written
+        if raw_data_key:
+            with open(key_path, "w") as key_file:
+                key_file.write(raw_data_key)
         
         print("Data processing pipeline completed!")
         return processed_datasets
@@ -3,6 +3,7 @@ import time
 from datetime import datetime
 import logging
 from data_processor import CustomerDataProcessor
+from data_cleaner import DataCleaner
 from data_collection.customer_simulator import CustomerBehaviorSimulator
 
 # Set up logging
@@ -18,6 +19,7 @@ logging.basicConfig(
 class DataPipelineScheduler:
     def __init__(self):
         self.simulator = CustomerBehaviorSimulator()
+        self.cleaner = DataCleaner()
         self.processor = CustomerDataProcessor()
         
     def run_data_collection(self):
@@ -26,7 +28,10 @@ class DataPipelineScheduler:
             logging.info("Starting data collection job...")
             self.simulator.generate_customers()
             self.simulator.generate_interactions()
-            self.simulator.save_data()
+            customers_df, interactions_df = self.simulator.save_data()
+            # Clean the frames still in memory instead of parsing the CSVs just written
+            self.cleaner.clean_customers_data(customers_df)
+            self.cleaner.clean_interactions_data(interactions_df)
             logging.info("Data collection completed successfully")
         except Exception as e:
             logging.error(f"Data collection failed: {str(e)}")
@@ -71,10 +76,10 @@ def main():
     print("\nRunning pipeline once for testing...")
     scheduler.run_full_pipeline()
     
-    # Keep the scheduler running
+    # Keep the scheduler running, sleeping until the next job is due instead of polling every minute
     while True:
+        time.sleep(max(1, schedule.idle_seconds()))
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,31 +1,206 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
+from google.cloud.bigquery_storage_v1 import types as storage_types, writer as storage_writer
 from google.cloud.exceptions import NotFound
+from google.oauth2 import service_account
+import google.auth
+from google.auth.credentials import with_scopes_if_required
+from google.auth.transport.requests import AuthorizedSession
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import streamlit as st
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import tempfile
+
+# SQL scripts that rebuild the dashboard's pre-aggregated summary tables
+MATERIALIZATIONS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sql", "materializations"
+)
+
+# Arrow types the Storage Write API expects for each BigQuery column type
+WRITE_API_ARROW_TYPES = {
+    'STRING': pa.string(),
+    'INTEGER': pa.int64(),
+    'FLOAT': pa.float64(),
+    'BOOLEAN': pa.bool_(),
+    'DATE': pa.date32(),
+    'TIMESTAMP': pa.timestamp('us', tz='UTC')
+}
+
+# Appends smaller than this still go through a load job - the stream setup isn't worth it.
+# Truncating uploads always use a load job, which replaces the table atomically.
+WRITE_API_MIN_ROWS = 50000
+
+# Keep each AppendRows request well under the API's 10MB limit
+WRITE_API_MAX_REQUEST_BYTES = 8 * 1024 * 1024
+
+# Connections kept open to BigQuery - enough for every table's load job at once
+HTTP_POOL_SIZE = 8
+
+# Table schemas, built once at import rather than on every upload
+TABLE_SCHEMAS: Dict[str, Tuple[bigquery.SchemaField, ...]] = {
+    'customers': (
+        bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("first_name", "STRING"),
+        bigquery.SchemaField("last_name", "STRING"),
+        bigquery.SchemaField("email", "STRING"),
+        bigquery.SchemaField("phone", "STRING"),
+        bigquery.SchemaField("age", "INTEGER"),
+        bigquery.SchemaField("gender", "STRING"),
+        bigquery.SchemaField("city", "STRING"),
+        bigquery.SchemaField("state", "STRING"),
+        bigquery.SchemaField("country", "STRING"),
+        bigquery.SchemaField("registration_date", "DATE"),
+        bigquery.SchemaField("customer_segment", "STRING"),
+        bigquery.SchemaField("preferred_channel", "STRING"),
+        bigquery.SchemaField("lifetime_value", "FLOAT"),
+    ),
+    'interactions': (
+        bigquery.SchemaField("interaction_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("touchpoint", "STRING"),
+        bigquery.SchemaField("timestamp", "TIMESTAMP"),
+        bigquery.SchemaField("session_duration_minutes", "INTEGER"),
+        bigquery.SchemaField("pages_viewed", "INTEGER"),
+        bigquery.SchemaField("action_taken", "STRING"),
+        bigquery.SchemaField("product_category", "STRING"),
+        bigquery.SchemaField("revenue", "FLOAT"),
+        bigquery.SchemaField("device_type", "STRING"),
+        bigquery.SchemaField("referrer_source", "STRING"),
+        bigquery.SchemaField("campaign_id", "STRING"),
+    ),
+    'customer_journeys': (
+        bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("journey_path", "STRING"),
+        bigquery.SchemaField("total_interactions", "INTEGER"),
+        bigquery.SchemaField("total_revenue", "FLOAT"),
+        bigquery.SchemaField("journey_duration_days", "INTEGER"),
+        bigquery.SchemaField("first_touchpoint", "STRING"),
+        bigquery.SchemaField("last_touchpoint", "STRING"),
+        bigquery.SchemaField("unique_touchpoints", "INTEGER"),
+        bigquery.SchemaField("conversion_occurred", "BOOLEAN"),
+        bigquery.SchemaField("touchpoint_counts", "STRING"),
+    ),
+    'touchpoint_analysis': (
+        bigquery.SchemaField("touchpoint", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("total_interactions", "INTEGER"),
+        bigquery.SchemaField("total_revenue", "FLOAT"),
+        bigquery.SchemaField("avg_revenue_per_interaction", "FLOAT"),
+        bigquery.SchemaField("avg_session_duration", "FLOAT"),
+        bigquery.SchemaField("unique_customers", "INTEGER"),
+        bigquery.SchemaField("conversion_rate", "FLOAT"),
+    ),
+    'customer_segments': (
+        bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("first_name", "STRING"),
+        bigquery.SchemaField("last_name", "STRING"),
+        bigquery.SchemaField("email", "STRING"),
+        bigquery.SchemaField("phone", "STRING"),
+        bigquery.SchemaField("age", "INTEGER"),
+        bigquery.SchemaField("gender", "STRING"),
+        bigquery.SchemaField("city", "STRING"),
+        bigquery.SchemaField("state", "STRING"),
+        bigquery.SchemaField("country", "STRING"),
+        bigquery.SchemaField("registration_date", "DATE"),
+        bigquery.SchemaField("customer_segment", "STRING"),
+        bigquery.SchemaField("preferred_channel", "STRING"),
+        bigquery.SchemaField("lifetime_value", "FLOAT"),
+        bigquery.SchemaField("total_interactions", "INTEGER"),
+        bigquery.SchemaField("total_revenue", "FLOAT"),
+        bigquery.SchemaField("unique_touchpoints_used", "INTEGER"),
+        bigquery.SchemaField("avg_session_duration", "FLOAT"),
+        bigquery.SchemaField("first_interaction", "TIMESTAMP"),
+        bigquery.SchemaField("last_interaction", "TIMESTAMP"),
+        bigquery.SchemaField("recency_days", "INTEGER"),
+        bigquery.SchemaField("frequency_score", "STRING"),
+        bigquery.SchemaField("monetary_score", "STRING"),
+        bigquery.SchemaField("recency_score", "STRING"),
+    ),
+    'time_series_data': (
+        bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("daily_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_unique_customers", "INTEGER"),
+        bigquery.SchemaField("daily_revenue", "FLOAT"),
+        bigquery.SchemaField("avg_session_duration", "FLOAT"),
+        bigquery.SchemaField("daily_website_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_mobile_app_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_email_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_social_media_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_store_visit_interactions", "INTEGER"),
+        bigquery.SchemaField("daily_customer_service_interactions", "INTEGER"),
+    )
+}
+
+# Column names per table, in schema order
+TABLE_SCHEMA_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    table_name: tuple(field.name for field in schema)
+    for table_name, schema in TABLE_SCHEMAS.items()
+}
+
+def get_credentials(credentials_path: str = None) -> Optional[service_account.Credentials]:
+    """Get credentials from Streamlit secrets or a key file, built in memory"""
+    if hasattr(st, 'secrets') and 'GOOGLE_APPLICATION_CREDENTIALS' in st.secrets:
+        # Running in Streamlit Cloud - nothing is written to disk or the environment
+        credentials_dict = dict(st.secrets["GOOGLE_APPLICATION_CREDENTIALS"])
+        return service_account.Credentials.from_service_account_info(credentials_dict)
+    
+    # Running locally - fall back to application default credentials if there is no key file
+    credentials_path = credentials_path or os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service-account-key.json')
+    if os.path.exists(credentials_path):
+        return service_account.Credentials.from_service_account_file(credentials_path)
+    return None
+
+def build_http_session(credentials, pool_size: int = HTTP_POOL_SIZE) -> AuthorizedSession:
+    """Build an authorized session for the BigQuery client with a wider connection pool"""
+    if credentials is None:
+        credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+    else:
+        credentials = with_scopes_if_required(credentials, bigquery.Client.SCOPE)
+    
+    session = AuthorizedSession(credentials)
+    session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+    return session
 
 class BigQueryManager:
     def __init__(self, project_id: str = None, credentials_path: str = None):
         if hasattr(st, 'secrets'):
             self.project_id = project_id or st.secrets["GCP_PROJECT_ID"]
             self.dataset_id = st.secrets.get("BQ_DATASET_ID", "customer_behavior")
-            credentials_path = get_credentials()
         else:
             self.project_id = project_id or os.getenv('GCP_PROJECT_ID')
             self.dataset_id = os.getenv('BQ_DATASET_ID', 'customer_behavior')
-            credentials_path = credentials_path or os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
         
-        # Set up credentials
-        if credentials_path:
-            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+        # Credentials are passed in memory - no temp key file and no environment mutation
+        credentials = get_credentials(credentials_path)
+        self.credentials = credentials
         
-        self.client = bigquery.Client(project=self.project_id)
+        # The client's session gets a wider connection pool so overlapping load jobs reuse connections
+        self.client = bigquery.Client(
+            project=self.project_id, credentials=credentials, _http=build_http_session(credentials)
+        )
         self.dataset_ref = self.client.dataset(self.dataset_id)
+        self._table_refs: Dict[str, bigquery.TableReference] = {}
+        
+        # Storage Read API client streams query results as Arrow instead of paging JSON rows
+        self.bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+        self._write_client: Optional[bigquery_storage.BigQueryWriteClient] = None
         
+    def get_write_client(self) -> bigquery_storage.BigQueryWriteClient:
+        """Storage Write API client for large appends, opened on first use since most runs never need it"""
+        if self._write_client is None:
+            self._write_client = bigquery_storage.BigQueryWriteClient(credentials=self.credentials)
+        return self._write_client
+    
+    def get_table_ref(self, table_name: str) -> bigquery.TableReference:
+        """Get the reference for a table in the dataset, built once per table"""
+        if table_name not in self._table_refs:
+            self._table_refs[table_name] = self.dataset_ref.table(table_name)
+        return self._table_refs[table_name]
+    
     def create_dataset(self) -> None:
         """Create BigQuery dataset if it doesn't exist"""
         try:
@@ -39,120 +214,13 @@ class BigQueryManager:
             dataset = self.client.create_dataset(dataset, timeout=30)
             print(f"Created dataset {self.dataset_id}")
     
-    def get_credentials():
-        """Get credentials from Streamlit secrets or environment"""
-        if hasattr(st, 'secrets'):
-            # Running in Streamlit Cloud
-            credentials_dict = dict(st.secrets["GOOGLE_APPLICATION_CREDENTIALS"])
-            
-            # Create temporary file for credentials
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(credentials_dict, f)
-                return f.name
-        else:
-            # Running locally
-            return os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service-account-key.json')
-        
     def get_table_schema(self, table_name: str) -> List[bigquery.SchemaField]:
         """Define schemas for different tables"""
-        schemas = {
-            'customers': [
-                bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("first_name", "STRING"),
-                bigquery.SchemaField("last_name", "STRING"),
-                bigquery.SchemaField("email", "STRING"),
-                bigquery.SchemaField("phone", "STRING"),
-                bigquery.SchemaField("age", "INTEGER"),
-                bigquery.SchemaField("gender", "STRING"),
-                bigquery.SchemaField("city", "STRING"),
-                bigquery.SchemaField("state", "STRING"),
-                bigquery.SchemaField("country", "STRING"),
-                bigquery.SchemaField("registration_date", "DATE"),
-                bigquery.SchemaField("customer_segment", "STRING"),
-                bigquery.SchemaField("preferred_channel", "STRING"),
-                bigquery.SchemaField("lifetime_value", "FLOAT"),
-            ],
-            'interactions': [
-                bigquery.SchemaField("interaction_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("touchpoint", "STRING"),
-                bigquery.SchemaField("timestamp", "TIMESTAMP"),
-                bigquery.SchemaField("session_duration_minutes", "INTEGER"),
-                bigquery.SchemaField("pages_viewed", "INTEGER"),
-                bigquery.SchemaField("action_taken", "STRING"),
-                bigquery.SchemaField("product_category", "STRING"),
-                bigquery.SchemaField("revenue", "FLOAT"),
-                bigquery.SchemaField("device_type", "STRING"),
-                bigquery.SchemaField("referrer_source", "STRING"),
-                bigquery.SchemaField("campaign_id", "STRING"),
-            ],
-            'customer_journeys': [
-                bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("journey_path", "STRING"),
-                bigquery.SchemaField("total_interactions", "INTEGER"),
-                bigquery.SchemaField("total_revenue", "FLOAT"),
-                bigquery.SchemaField("journey_duration_days", "INTEGER"),
-                bigquery.SchemaField("first_touchpoint", "STRING"),
-                bigquery.SchemaField("last_touchpoint", "STRING"),
-                bigquery.SchemaField("unique_touchpoints", "INTEGER"),
-                bigquery.SchemaField("conversion_occurred", "BOOLEAN"),
-                bigquery.SchemaField("touchpoint_counts", "STRING"),
-            ],
-            'touchpoint_analysis': [
-                bigquery.SchemaField("touchpoint", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("total_interactions", "INTEGER"),
-                bigquery.SchemaField("total_revenue", "FLOAT"),
-                bigquery.SchemaField("avg_revenue_per_interaction", "FLOAT"),
-                bigquery.SchemaField("avg_session_duration", "FLOAT"),
-                bigquery.SchemaField("unique_customers", "INTEGER"),
-                bigquery.SchemaField("conversion_rate", "FLOAT"),
-            ],
-            'customer_segments': [
-                bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("first_name", "STRING"),
-                bigquery.SchemaField("last_name", "STRING"),
-                bigquery.SchemaField("email", "STRING"),
-                bigquery.SchemaField("phone", "STRING"),
-                bigquery.SchemaField("age", "INTEGER"),
-                bigquery.SchemaField("gender", "STRING"),
-                bigquery.SchemaField("city", "STRING"),
-                bigquery.SchemaField("state", "STRING"),
-                bigquery.SchemaField("country", "STRING"),
-                bigquery.SchemaField("registration_date", "DATE"),
-                bigquery.SchemaField("customer_segment", "STRING"),
-                bigquery.SchemaField("preferred_channel", "STRING"),
-                bigquery.SchemaField("lifetime_value", "FLOAT"),
-                bigquery.SchemaField("total_interactions", "INTEGER"),
-                bigquery.SchemaField("total_revenue", "FLOAT"),
-                bigquery.SchemaField("unique_touchpoints_used", "INTEGER"),
-                bigquery.SchemaField("avg_session_duration", "FLOAT"),
-                bigquery.SchemaField("first_interaction", "TIMESTAMP"),
-                bigquery.SchemaField("last_interaction", "TIMESTAMP"),
-                bigquery.SchemaField("recency_days", "INTEGER"),
-                bigquery.SchemaField("frequency_score", "STRING"),
-                bigquery.SchemaField("monetary_score", "STRING"),
-                bigquery.SchemaField("recency_score", "STRING"),
-            ],
-            'time_series_data': [
-                bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
-                bigquery.SchemaField("daily_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_unique_customers", "INTEGER"),
-                bigquery.SchemaField("daily_revenue", "FLOAT"),
-                bigquery.SchemaField("avg_session_duration", "FLOAT"),
-                bigquery.SchemaField("daily_website_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_mobile_app_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_email_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_social_media_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_store_visit_interactions", "INTEGER"),
-                bigquery.SchemaField("daily_customer_service_interactions", "INTEGER"),
-            ]
-        }
-        
-        return schemas.get(table_name, [])
+        return list(TABLE_SCHEMAS.get(table_name, ()))
 
     def create_table(self, table_name: str) -> None:
         """Create a table with the appropriate schema"""
-        table_ref = self.dataset_ref.table(table_name)
+        table_ref = self.get_table_ref(table_name)
         
         try:
             self.client.get_table(table_ref)
@@ -166,7 +234,19 @@ class BigQueryManager:
     def upload_dataframe(self, df: pd.DataFrame, table_name: str, 
                         write_disposition: str = "WRITE_TRUNCATE") -> None:
         """Upload a pandas DataFrame to BigQuery"""
-        table_ref = self.dataset_ref.table(table_name)
+        if len(df) >= WRITE_API_MIN_ROWS and write_disposition == "WRITE_APPEND":
+            self.write_dataframe(df, table_name)
+            return
+        
+        job = self.start_dataframe_load(df, table_name, write_disposition)
+        job.result()  # Wait for the job to complete
+        
+        print(f"Uploaded {len(df)} rows to {table_name}")
+    
+    def start_dataframe_load(self, df: pd.DataFrame, table_name: str,
+                             write_disposition: str = "WRITE_TRUNCATE") -> bigquery.LoadJob:
+        """Send a DataFrame to BigQuery and return the load job without waiting for it"""
+        table_ref = self.get_table_ref(table_name)
         
         # Configure the load job
         job_config = bigquery.LoadJobConfig(
@@ -174,16 +254,61 @@ class BigQueryManager:
             schema=self.get_table_schema(table_name)
         )
         
-        # Upload the data
-        job = self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
-        job.result()  # Wait for the job to complete
+        return self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
+    
+    def write_dataframe(self, df: pd.DataFrame, table_name: str) -> None:
+        """Append a DataFrame to an existing table through the Storage Write API
         
-        print(f"Uploaded {len(df)} rows to {table_name}")
+        Rows go to a pending stream that is committed atomically once every batch is
+        acknowledged, so a failed upload leaves the table as it was. Values that don't fit
+        their column's type (e.g. fractional floats for an INTEGER field) raise before any
+        stream is opened.
+        """
+        schema = pa.schema([
+            pa.field(field.name, WRITE_API_ARROW_TYPES[field.field_type])
+            for field in self.get_table_schema(table_name) if field.name in df.columns
+        ])
+        table = pa.Table.from_pandas(df[schema.names], preserve_index=False).cast(schema)
+        
+        write_client = self.get_write_client()
+        parent = write_client.table_path(self.project_id, self.dataset_id, table_name)
+        write_stream = write_client.create_write_stream(
+            parent=parent,
+            write_stream=storage_types.WriteStream(type_=storage_types.WriteStream.Type.PENDING)
+        )
+        
+        request_template = storage_types.AppendRowsRequest(write_stream=write_stream.name)
+        request_template.arrow_rows.writer_schema.serialized_schema = schema.serialize().to_pybytes()
+        append_rows_stream = storage_writer.AppendRowsStream(write_client, request_template)
+        
+        # Size batches so each request stays under the per-request limit
+        rows_per_request = max(1, len(table) * WRITE_API_MAX_REQUEST_BYTES // max(table.nbytes, 1))
+        futures = []
+        for batch in table.to_batches(max_chunksize=rows_per_request):
+            request = storage_types.AppendRowsRequest()
+            request.arrow_rows.rows.serialized_record_batch = batch.serialize().to_pybytes()
+            futures.append(append_rows_stream.send(request))
+        
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            append_rows_stream.close()
+        
+        write_client.finalize_write_stream(name=write_stream.name)
+        
+        response = write_client.batch_commit_write_streams(
+            storage_types.BatchCommitWriteStreamsRequest(parent=parent, write_streams=[write_stream.name])
+        )
+        if response.stream_errors:
+            raise RuntimeError(f"Failed to commit rows to {table_name}: {response.stream_errors}")
+        
+        print(f"Uploaded {len(table)} rows to {table_name}")
     
     def upload_csv_file(self, file_path: str, table_name: str,
                        write_disposition: str = "WRITE_TRUNCATE") -> None:
         """Upload a CSV file directly to BigQuery"""
-        table_ref = self.dataset_ref.table(table_name)
+        table_ref = self.get_table_ref(table_name)
         
         job_config = bigquery.LoadJobConfig(
             source_format=bigquery.SourceFormat.CSV,
@@ -199,9 +324,50 @@ class BigQueryManager:
         job.result()  # Wait for the job to complete
         print(f"Uploaded {file_path} to {table_name}")
     
+    def upload_parquet_file(self, file_path: str, table_name: str,
+                           write_disposition: str = "WRITE_TRUNCATE") -> None:
+        """Upload a Parquet file directly to BigQuery as a batch load job"""
+        job = self.start_parquet_load(file_path, table_name, write_disposition)
+        job.result()  # Wait for the job to complete
+        print(f"Uploaded {file_path} to {table_name}")
+    
+    def start_parquet_load(self, file_path: str, table_name: str,
+                           write_disposition: str = "WRITE_TRUNCATE") -> bigquery.LoadJob:
+        """Send a Parquet file to BigQuery and return the load job without waiting for it"""
+        table_ref = self.get_table_ref(table_name)
+        
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            schema=self.get_table_schema(table_name),
+            write_disposition=write_disposition
+        )
+        
+        with open(file_path, "rb") as source_file:
+            return self.client.load_table_from_file(source_file, table_ref, job_config=job_config)
+    
+    def wait_for_loads(self, jobs: Dict[str, bigquery.LoadJob]) -> None:
+        """Wait for load jobs keyed by table name, which run concurrently on the BigQuery side"""
+        for table_name, job in jobs.items():
+            job.result()
+            print(f"Uploaded {job.output_rows} rows to {table_name}")
+    
+    def read_parquet_for_table(self, file_path: str, table_name: str) -> pd.DataFrame:
+        """Read only a table's schema columns from a processed Parquet file"""
+        file_columns = set(pq.read_schema(file_path).names)
+        columns = [col for col in TABLE_SCHEMA_COLUMNS.get(table_name, ()) if col in file_columns]
+        return pd.read_parquet(file_path, engine='pyarrow', columns=columns)
+    
     def query_data(self, query: str) -> pd.DataFrame:
         """Execute a query and return results as DataFrame"""
-        return self.client.query(query).to_dataframe()
+        return self.client.query(query).result().to_dataframe(
+            bqstorage_client=self.bqstorage_client,
+            create_bqstorage_client=False
+        )
+    
+    def get_table_row_counts(self) -> Dict[str, int]:
+        """Get row counts for every table in the dataset from metadata, without scanning any table"""
+        query = f"SELECT table_id, row_count FROM `{self.project_id}.{self.dataset_id}.__TABLES__`"
+        return {row.table_id: row.row_count for row in self.client.query(query).result()}
     
     def setup_all_tables(self) -> None:
         """Create dataset and all required tables"""
@@ -212,94 +378,89 @@ class BigQueryManager:
         tables = ['customers', 'interactions', 'customer_journeys', 
                  'touchpoint_analysis', 'customer_segments', 'time_series_data']
         
-        for table in tables:
-            self.create_table(table)
+        # Each table is an independent get/create round trip, so issue them together
+        with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+            list(executor.map(self.create_table, tables))
         
         print("BigQuery setup completed!")
     
-    def upload_all_processed_data(self, data_path: str = "data/processed/") -> None:
-        """Upload all processed data using DataFrames for better compatibility"""
+    def refresh_materializations(self, sql_path: str = MATERIALIZATIONS_PATH) -> None:
+        """Rebuild the pre-aggregated summary tables the dashboard reads"""
+        for file_name in sorted(os.listdir(sql_path)):
+            if not file_name.endswith('.sql'):
+                continue
+            
+            with open(os.path.join(sql_path, file_name)) as sql_file:
+                query = sql_file.read().format(project_id=self.project_id, dataset_id=self.dataset_id)
+            
+            self.client.query(query).result()
+            print(f"Refreshed {file_name.replace('.sql', '')}")
+    
+    def read_processed_data(self, data_path: str = "data/processed/") -> Dict[str, pd.DataFrame]:
+        """Read the processed Parquet files into DataFrames keyed by table name"""
+        processed_files = {
+            'customer_journeys_clean.parquet': 'customer_journeys',
+            'touchpoint_analysis_clean.parquet': 'touchpoint_analysis', 
+            'customer_segments_clean.parquet': 'customer_segments',
+            'time_series_data_clean.parquet': 'time_series_data'
+        }
+        
+        datasets = {}
+        for file_name, table_name in processed_files.items():
+            file_path = os.path.join(data_path, file_name)
+            if not os.path.exists(file_path):
+                # Try original file if clean version doesn't exist
+                original_path = os.path.join(data_path, file_name.replace('_clean', ''))
+                if not os.path.exists(original_path):
+                    print(f"Warning: Neither {file_path} nor {original_path} found")
+                    continue
+                file_path = original_path
+            
+            datasets[table_name] = self.read_parquet_for_table(file_path, table_name)
+        return datasets
+    
+    def upload_dataframes(self, datasets: Dict[str, pd.DataFrame]) -> None:
+        """Upload in-memory DataFrames keyed by table name, keeping only each table's schema columns"""
+        # Start every load before waiting on any of them so the jobs overlap
+        jobs = {}
+        for table_name, df in datasets.items():
+            schema_columns = TABLE_SCHEMA_COLUMNS.get(table_name, ())
+            df = df[[col for col in schema_columns if col in df.columns]]
+            jobs[table_name] = self.start_dataframe_load(df, table_name)
+        self.wait_for_loads(jobs)
+    
+    def upload_all_processed_data(self, data_path: str = "data/processed/",
+                                  processed_datasets: Dict[str, pd.DataFrame] = None) -> None:
+        """Upload all processed data using DataFrames for better compatibility
+        
+        Pass the dict returned by CustomerDataProcessor.process_all_data as processed_datasets
+        to upload those frames directly instead of re-reading the processed files.
+        """
         print("Uploading processed data to BigQuery...")
         
         try:
             # Upload raw data first
             raw_data_path = "data/raw/"
             
-            # Upload customers
-            customers_clean_path = os.path.join(raw_data_path, "customers_clean.csv")
+            # Upload customers and interactions - the cleaner writes these as typed Parquet,
+            # so they load straight from file without a pandas round trip
+            raw_jobs = {}
+            customers_clean_path = os.path.join(raw_data_path, "customers_clean.parquet")
             if os.path.exists(customers_clean_path):
-                customers_df = pd.read_csv(customers_clean_path)
-                # Convert date column
-                customers_df['registration_date'] = pd.to_datetime(customers_df['registration_date']).dt.date
-                self.upload_dataframe(customers_df, "customers")
+                raw_jobs["customers"] = self.start_parquet_load(customers_clean_path, "customers")
             
-            # Upload interactions
-            interactions_clean_path = os.path.join(raw_data_path, "interactions_clean.csv")
+            interactions_clean_path = os.path.join(raw_data_path, "interactions_clean.parquet")
             if os.path.exists(interactions_clean_path):
-                interactions_df = pd.read_csv(interactions_clean_path)
-                # Convert timestamp column
-                interactions_df['timestamp'] = pd.to_datetime(interactions_df['timestamp'])
-                self.upload_dataframe(interactions_df, "interactions")
+                raw_jobs["interactions"] = self.start_parquet_load(interactions_clean_path, "interactions")
             
-            # Upload processed data
-            processed_files = {
-                'customer_journeys_clean.csv': 'customer_journeys',
-                'touchpoint_analysis_clean.csv': 'touchpoint_analysis', 
-                'customer_segments_clean.csv': 'customer_segments',
-                'time_series_data_clean.csv': 'time_series_data'
-            }
+            # Upload processed data while the raw loads are still running
+            if processed_datasets is None:
+                processed_datasets = self.read_processed_data(data_path)
+            self.upload_dataframes(processed_datasets)
+            self.wait_for_loads(raw_jobs)
             
-            for file_name, table_name in processed_files.items():
-                file_path = os.path.join(data_path, file_name)
-                if os.path.exists(file_path):
-                    df = pd.read_csv(file_path)
-                    
-                    # Handle specific data type conversions
-                    if table_name == 'customer_segments':
-                        # Convert date columns
-                        if 'registration_date' in df.columns:
-                            df['registration_date'] = pd.to_datetime(df['registration_date']).dt.date
-                        if 'first_interaction' in df.columns:
-                            df['first_interaction'] = pd.to_datetime(df['first_interaction'])
-                        if 'last_interaction' in df.columns:
-                            df['last_interaction'] = pd.to_datetime(df['last_interaction'])
-                    
-                    elif table_name == 'time_series_data':
-                        # Convert date column
-                        if 'date' in df.columns:
-                            df['date'] = pd.to_datetime(df['date']).dt.date
-                    
-                    # Select only columns that match our schema
-                    schema_columns = [field.name for field in self.get_table_schema(table_name)]
-                    df_filtered = df[[col for col in schema_columns if col in df.columns]]
-                    
-                    self.upload_dataframe(df_filtered, table_name)
-                else:
-                    # Try original file if clean version doesn't exist
-                    original_file = file_name.replace('_clean', '')
-                    original_path = os.path.join(data_path, original_file)
-                    if os.path.exists(original_path):
-                        df = pd.read_csv(original_path)
-                        
-                        # Apply same transformations
-                        if table_name == 'customer_segments':
-                            if 'registration_date' in df.columns:
-                                df['registration_date'] = pd.to_datetime(df['registration_date']).dt.date
-                            if 'first_interaction' in df.columns:
-                                df['first_interaction'] = pd.to_datetime(df['first_interaction'])
-                            if 'last_interaction' in df.columns:
-                                df['last_interaction'] = pd.to_datetime(df['last_interaction'])
-                        elif table_name == 'time_series_data':
-                            if 'date' in df.columns:
-                                df['date'] = pd.to_datetime(df['date']).dt.date
-                        
-                        # Select only schema columns
-                        schema_columns = [field.name for field in self.get_table_schema(table_name)]
-                        df_filtered = df[[col for col in schema_columns if col in df.columns]]
-                        
-                        self.upload_dataframe(df_filtered, table_name)
-                    else:
-                        print(f"Warning: Neither {file_path} nor {original_path} found")
+            # Summary tables only change when their sources do, so rebuild them here
+            self.refresh_materializations()
             
             print("Data upload completed!")
             
@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -58,11 +59,16 @@ def setup_complete_bigquery():
         return False
     
     try:
-        print("\n🏗️  Setting up BigQuery dataset and tables...")
-        bq_manager.setup_all_tables()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Read the processed files while the dataset and tables are being created
+            processed_future = executor.submit(bq_manager.read_processed_data)
+            
+            print("\n🏗️  Setting up BigQuery dataset and tables...")
+            bq_manager.setup_all_tables()
+            processed_datasets = processed_future.result()
         
         print("\n📤 Uploading data to BigQuery...")
-        bq_manager.upload_all_processed_data()
+        bq_manager.upload_all_processed_data(processed_datasets=processed_datasets)
         
         print("\n🧪 Testing with a sample query...")
         query = f"""
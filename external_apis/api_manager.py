@@ -1,16 +1,102 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import json
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import orjson
 import os
+import random
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import time
+import threading
 import asyncio
 import aiohttp
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+import diskcache
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop doesn't support Windows
+    uvloop = None
+
 load_dotenv()
 
+# API endpoints and the query parameters that never change between calls
+WEATHER_API_URL = "http://api.openweathermap.org/data/2.5/weather"
+WEATHER_BASE_PARAMS = {'units': 'metric'}
+STOCK_API_URL = "https://www.alphavantage.co/query"
+STOCK_BASE_PARAMS = {'function': 'GLOBAL_QUOTE'}
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_BASE_PARAMS = {'language': 'en', 'sortBy': 'publishedAt', 'pageSize': 10}
+
+# On-disk copy of the API response cache, so restarts and replays don't re-hit the APIs.
+# Anchored at the project root so the dashboards, scheduler and scripts all share it
+API_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "api"
+)
+
+# Simple sentiment analysis based on keywords; matched as substrings so "gains" or "falling" count too
+POSITIVE_KEYWORDS = ['growth', 'increase', 'positive', 'success', 'profit', 'gain']
+NEGATIVE_KEYWORDS = ['decline', 'decrease', 'negative', 'loss', 'drop', 'fall']
+
+# Mock geographic data
+CITY_DATA = {
+    'New York': {'population': 8400000, 'median_income': 65000, 'timezone': 'EST'},
+    'Los Angeles': {'population': 4000000, 'median_income': 62000, 'timezone': 'PST'},
+    'Chicago': {'population': 2700000, 'median_income': 58000, 'timezone': 'CST'},
+    'Houston': {'population': 2300000, 'median_income': 55000, 'timezone': 'CST'},
+}
+DEFAULT_CITY_DATA = {'population': 1000000, 'median_income': 60000, 'timezone': 'EST'}
+
+@lru_cache(maxsize=2)
+def _iso_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+def _now_iso() -> str:
+    """Current time as an ISO string at one-second resolution, formatted once per second"""
+    return _iso_timestamp(int(time.time()))
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an API whose circuit breaker is open"""
+
+class APIQuotaError(ValueError):
+    """Raised when an API answers with a quota/rate-limit message instead of data"""
+
+class CircuitBreaker:
+    """Stops calling an API after fail_max consecutive failures until reset_timeout seconds have passed,
+    then lets calls through again; one more failure reopens it, a success closes it"""
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 60):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+    
+    def before_call(self):
+        if self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout:
+            raise CircuitOpenError(f"{self.name} API circuit open after {self.failures} consecutive failures")
+    
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            self.opened_at = time.monotonic()
+
+# Failures that fall back to (unpersisted) mock data: an open circuit, an unreachable or erroring API, or an unexpected payload
+FETCH_ERRORS = (
+    CircuitOpenError, requests.RequestException, aiohttp.ClientError, asyncio.TimeoutError,
+    KeyError, IndexError, TypeError, ValueError
+)
+
 class ExternalAPIManager:
     def __init__(self):
         # API Keys (add these to your .env file)
@@ -18,9 +104,28 @@ class ExternalAPIManager:
         self.news_api_key = os.getenv('NEWS_API_KEY')
         self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_API_KEY')
         
+        # Keep-alive session for the blocking fetchers, retrying throttled and failed requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Cache for API responses (avoid rate limits)
-        self.cache = {}
         self.cache_duration = 300  # 5 minutes
+        self.cache = TTLCache(maxsize=2048, ttl=self.cache_duration)
+        self._cache_lock = threading.Lock()  # TTLCache isn't thread-safe and the manager is shared
+        self.disk_cache = diskcache.Cache(API_CACHE_DIR, size_limit=2**30)
+        
+        # RNGs for mock data: one call at a time, and vectorized for draws in bulk
+        self._rng = random.Random()
+        self.batch_rng = np.random.default_rng()
+        
+        # Futures for async fetches still in flight, so concurrent callers share one request
+        self.inflight = {}
         
         # Rate limiting
         self.last_api_calls = {}
@@ -29,30 +134,97 @@ class ExternalAPIManager:
             'news': 2,     # 2 seconds between calls
             'stocks': 1,   # 1 second between calls
         }
-    
-    def is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid"""
-        if cache_key not in self.cache:
-            return False
+        self.breakers = {api_name: CircuitBreaker(api_name) for api_name in self.rate_limits}
         
-        cache_time = self.cache[cache_key].get('timestamp', 0)
-        return (time.time() - cache_time) < self.cache_duration
+        # Async rate limiting: provider quotas as (requests, seconds), plus a cap
+        # on concurrent requests per API. Both bind to the event loop that first
+        # uses them, so the blocking wrappers below run on one private loop
+        self.limiters = {
+            'weather': AsyncLimiter(60, 60),
+            'news': AsyncLimiter(30, 60),
+            'stocks': AsyncLimiter(5, 60),
+        }
+        self.semaphores = {api_name: asyncio.Semaphore(10) for api_name in self.limiters}
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._async_session = None
     
-    def get_cached_or_fetch(self, cache_key: str, fetch_function, *args, **kwargs):
-        """Get data from cache or fetch from API"""
-        if self.is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+    def get_cached_or_fetch(self, cache_key: str, fetch_function, mock_function, *args, **kwargs):
+        """Get data from cache or fetch from API, falling back to mock data if the fetch fails"""
+        data = self.get_cached(cache_key)
+        if data is not None:
+            return data
         
         # Fetch new data
-        data = fetch_function(*args, **kwargs)
-        if data:
-            self.cache[cache_key] = {
-                'data': data,
-                'timestamp': time.time()
-            }
+        try:
+            data = fetch_function(*args, **kwargs)
+        except FETCH_ERRORS as e:
+            return self._cache_mock(cache_key, mock_function, e)
+        self.store_in_cache(cache_key, data)
+        return data
+    
+    async def get_cached_or_fetch_async(self, cache_key: str, fetch_function, mock_function, *args, **kwargs):
+        """Get data from cache or await a fetch coroutine, joining any identical fetch already running
+        and falling back to mock data if the fetch fails"""
+        data = self.get_cached(cache_key)
+        if data is not None:
+            return data
         
+        future = self.inflight.get(cache_key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[cache_key] = future
+        try:
+            try:
+                data = await fetch_function(*args, **kwargs)
+            except FETCH_ERRORS as e:
+                data = self._cache_mock(cache_key, mock_function, e)
+            else:
+                self.store_in_cache(cache_key, data)
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting on it
+            future.exception()
+            raise
+        finally:
+            del self.inflight[cache_key]
+    
+    def get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look a response up in memory first, then on disk"""
+        with self._cache_lock:
+            data = self.cache.get(cache_key)
+        if data is None:
+            data = self.disk_cache.get(cache_key)
         return data
     
+    def store_in_cache(self, cache_key: str, data: Dict[str, Any], persist: bool = True):
+        """Cache an API response in memory, and on disk too unless persist is False"""
+        if data:
+            with self._cache_lock:
+                self.cache[cache_key] = data
+            if persist:
+                self.disk_cache.set(cache_key, data, expire=self.cache_duration)
+    
+    def _cache_mock(self, cache_key: str, mock_function, error: Exception) -> Dict[str, Any]:
+        """Mock data standing in for a failed fetch - held in memory only, so an outage
+        never outlives a restart through the disk cache"""
+        print(f"Error fetching {cache_key}: {error}")
+        data = mock_function()
+        self.store_in_cache(cache_key, data, persist=False)
+        return data
+    
+    def cache_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of the unexpired in-memory cache entries"""
+        with self._cache_lock:
+            return dict(self.cache.items())
+    
     def respect_rate_limit(self, api_name: str):
         """Ensure we don't exceed API rate limits"""
         if api_name in self.last_api_calls:
@@ -64,58 +236,124 @@ class ExternalAPIManager:
         
         self.last_api_calls[api_name] = time.time()
     
+    def _get_json(self, api_name: str, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a JSON API endpoint on the pooled session, unless its circuit breaker is open"""
+        breaker = self.breakers[api_name]
+        breaker.before_call()
+        self.respect_rate_limit(api_name)
+        
+        try:
+            response = self.session.get(url, params=params, timeout=5)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except (requests.RequestException, ValueError):
+            breaker.record_failure()
+            raise
+        
+        breaker.record_success()
+        return data
+    
+    async def _get_json_async(self, session: aiohttp.ClientSession, api_name: str,
+                              url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a JSON API endpoint on the shared aiohttp session, within that API's quota
+        and unless its circuit breaker is open"""
+        breaker = self.breakers[api_name]
+        breaker.before_call()
+        
+        try:
+            async with self.limiters[api_name], self.semaphores[api_name]:
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            breaker.record_failure()
+            raise
+        
+        breaker.record_success()
+        return data
+    
+    def get_async_session(self) -> aiohttp.ClientSession:
+        """Pooled aiohttp session, kept open between batches so keep-alive connections are reused"""
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, keepalive_timeout=60)
+            self._async_session = aiohttp.ClientSession(connector=connector)
+        return self._async_session
+    
+    def close(self):
+        """Close the pooled HTTP sessions and the private event loop"""
+        self.session.close()
+        self.disk_cache.close()
+        if self._async_session is not None and not self._async_session.closed:
+            self._run_async(self._async_session.close())
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+    
+    def _run_async(self, coro):
+        """Run a coroutine to completion on this manager's private event loop"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+    
     def get_weather_data(self, city: str = "New York") -> Dict[str, Any]:
         """Get current weather data"""
         if not self.weather_api_key:
             return self._get_mock_weather_data()
         
         cache_key = f"weather_{city}"
-        return self.get_cached_or_fetch(cache_key, self._fetch_weather_data, city)
+        return self.get_cached_or_fetch(cache_key, self._fetch_weather_data, self._get_mock_weather_data, city)
+    
+    async def get_weather_data_async(self, session: aiohttp.ClientSession, city: str = "New York") -> Dict[str, Any]:
+        """Get current weather data without blocking the event loop"""
+        if not self.weather_api_key:
+            return self._get_mock_weather_data()
+        
+        cache_key = f"weather_{city}"
+        return await self.get_cached_or_fetch_async(
+            cache_key, self._fetch_weather_data_async, self._get_mock_weather_data, session, city
+        )
+    
+    def _weather_request(self, city: str) -> Tuple[str, Dict[str, Any]]:
+        """URL and query parameters for the OpenWeatherMap current weather endpoint"""
+        return WEATHER_API_URL, {**WEATHER_BASE_PARAMS, 'q': city, 'appid': self.weather_api_key}
+    
+    def _parse_weather_data(self, data: Dict[str, Any], city: str) -> Dict[str, Any]:
+        """Pick the fields we use out of an OpenWeatherMap response"""
+        return {
+            'temperature': data['main']['temp'],
+            'humidity': data['main']['humidity'],
+            'weather_condition': data['weather'][0]['main'],
+            'weather_description': data['weather'][0]['description'],
+            'wind_speed': data['wind']['speed'],
+            'pressure': data['main']['pressure'],
+            'visibility': data.get('visibility', 0) / 1000,  # Convert to km
+            'city': city,
+            'timestamp': _now_iso()
+        }
     
     def _fetch_weather_data(self, city: str) -> Dict[str, Any]:
         """Fetch weather data from OpenWeatherMap API"""
-        self.respect_rate_limit('weather')
-        
-        try:
-            url = f"http://api.openweathermap.org/data/2.5/weather"
-            params = {
-                'q': city,
-                'appid': self.weather_api_key,
-                'units': 'metric'
-            }
-            
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            return {
-                'temperature': data['main']['temp'],
-                'humidity': data['main']['humidity'],
-                'weather_condition': data['weather'][0]['main'],
-                'weather_description': data['weather'][0]['description'],
-                'wind_speed': data['wind']['speed'],
-                'pressure': data['main']['pressure'],
-                'visibility': data.get('visibility', 0) / 1000,  # Convert to km
-                'city': city,
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            print(f"Error fetching weather data: {e}")
-            return self._get_mock_weather_data()
+        url, params = self._weather_request(city)
+        return self._parse_weather_data(self._get_json('weather', url, params), city)
+    
+    async def _fetch_weather_data_async(self, session: aiohttp.ClientSession, city: str) -> Dict[str, Any]:
+        """Fetch weather data from OpenWeatherMap API on an aiohttp session"""
+        url, params = self._weather_request(city)
+        return self._parse_weather_data(await self._get_json_async(session, 'weather', url, params), city)
     
     def _get_mock_weather_data(self) -> Dict[str, Any]:
         """Generate mock weather data when API is not available"""
-        import random
         return {
-            'temperature': round(random.uniform(15, 30), 1),
-            'humidity': random.randint(40, 80),
-            'weather_condition': random.choice(['Clear', 'Clouds', 'Rain', 'Snow']),
+            'temperature': round(self._rng.uniform(15, 30), 1),
+            'humidity': self._rng.randint(40, 80),
+            'weather_condition': self._rng.choice(['Clear', 'Clouds', 'Rain', 'Snow']),
             'weather_description': 'mock data',
-            'wind_speed': round(random.uniform(0, 15), 1),
-            'pressure': random.randint(1000, 1020),
-            'visibility': round(random.uniform(5, 15), 1),
+            'wind_speed': round(self._rng.uniform(0, 15), 1),
+            'pressure': self._rng.randint(1000, 1020),
+            'visibility': round(self._rng.uniform(5, 15), 1),
             'city': 'Mock City',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     def get_stock_market_data(self, symbol: str = "SPY") -> Dict[str, Any]:
@@ -124,51 +362,61 @@ class ExternalAPIManager:
             return self._get_mock_stock_data()
         
         cache_key = f"stock_{symbol}"
-        return self.get_cached_or_fetch(cache_key, self._fetch_stock_data, symbol)
+        return self.get_cached_or_fetch(cache_key, self._fetch_stock_data, self._get_mock_stock_data, symbol)
+    
+    async def get_stock_market_data_async(self, session: aiohttp.ClientSession, symbol: str = "SPY") -> Dict[str, Any]:
+        """Get stock market data without blocking the event loop"""
+        if not self.alpha_vantage_key:
+            return self._get_mock_stock_data()
+        
+        cache_key = f"stock_{symbol}"
+        return await self.get_cached_or_fetch_async(
+            cache_key, self._fetch_stock_data_async, self._get_mock_stock_data, session, symbol
+        )
+    
+    def _stock_request(self, symbol: str) -> Tuple[str, Dict[str, Any]]:
+        """URL and query parameters for the Alpha Vantage global quote endpoint"""
+        return STOCK_API_URL, {**STOCK_BASE_PARAMS, 'symbol': symbol, 'apikey': self.alpha_vantage_key}
+    
+    def _parse_stock_data(self, data: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+        """Pick the fields we use out of an Alpha Vantage quote"""
+        # Alpha Vantage reports an exhausted quota as a 200 with a Note/Information message and no quote
+        if 'Global Quote' not in data and ('Note' in data or 'Information' in data):
+            raise APIQuotaError(data.get('Note') or data.get('Information'))
+        
+        quote = data.get('Global Quote', {})
+        
+        return {
+            'symbol': symbol,
+            'price': float(quote.get('05. price', 0)),
+            'change': float(quote.get('09. change', 0)),
+            'change_percent': quote.get('10. change percent', '0%').replace('%', ''),
+            'volume': int(quote.get('06. volume', 0)),
+            'market_sentiment': 'positive' if float(quote.get('09. change', 0)) > 0 else 'negative',
+            'timestamp': _now_iso()
+        }
     
     def _fetch_stock_data(self, symbol: str) -> Dict[str, Any]:
         """Fetch stock data from Alpha Vantage API"""
-        self.respect_rate_limit('stocks')
-        
-        try:
-            url = f"https://www.alphavantage.co/query"
-            params = {
-                'function': 'GLOBAL_QUOTE',
-                'symbol': symbol,
-                'apikey': self.alpha_vantage_key
-            }
-            
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            quote = data.get('Global Quote', {})
-            
-            return {
-                'symbol': symbol,
-                'price': float(quote.get('05. price', 0)),
-                'change': float(quote.get('09. change', 0)),
-                'change_percent': quote.get('10. change percent', '0%').replace('%', ''),
-                'volume': int(quote.get('06. volume', 0)),
-                'market_sentiment': 'positive' if float(quote.get('09. change', 0)) > 0 else 'negative',
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            print(f"Error fetching stock data: {e}")
-            return self._get_mock_stock_data()
+        url, params = self._stock_request(symbol)
+        return self._parse_stock_data(self._get_json('stocks', url, params), symbol)
+    
+    async def _fetch_stock_data_async(self, session: aiohttp.ClientSession, symbol: str) -> Dict[str, Any]:
+        """Fetch stock data from Alpha Vantage API on an aiohttp session"""
+        url, params = self._stock_request(symbol)
+        return self._parse_stock_data(await self._get_json_async(session, 'stocks', url, params), symbol)
     
     def _get_mock_stock_data(self) -> Dict[str, Any]:
         """Generate mock stock data"""
-        import random
-        change = round(random.uniform(-5, 5), 2)
+        change = round(self._rng.uniform(-5, 5), 2)
         return {
             'symbol': 'SPY',
-            'price': round(random.uniform(400, 450), 2),
+            'price': round(self._rng.uniform(400, 450), 2),
             'change': change,
             'change_percent': f"{(change/420)*100:.2f}",
-            'volume': random.randint(50000000, 100000000),
+            'volume': self._rng.randint(50000000, 100000000),
             'market_sentiment': 'positive' if change > 0 else 'negative',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     def get_news_sentiment(self, query: str = "retail shopping") -> Dict[str, Any]:
@@ -177,174 +425,274 @@ class ExternalAPIManager:
             return self._get_mock_news_sentiment()
         
         cache_key = f"news_{query}"
-        return self.get_cached_or_fetch(cache_key, self._fetch_news_sentiment, query)
+        return self.get_cached_or_fetch(cache_key, self._fetch_news_sentiment, self._get_mock_news_sentiment, query)
+    
+    async def get_news_sentiment_async(self, session: aiohttp.ClientSession, query: str = "retail shopping") -> Dict[str, Any]:
+        """Get news sentiment data without blocking the event loop"""
+        if not self.news_api_key:
+            return self._get_mock_news_sentiment()
+        
+        cache_key = f"news_{query}"
+        return await self.get_cached_or_fetch_async(
+            cache_key, self._fetch_news_sentiment_async, self._get_mock_news_sentiment, session, query
+        )
+    
+    def _news_request(self, query: str) -> Tuple[str, Dict[str, Any]]:
+        """URL and query parameters for the News API everything endpoint"""
+        return NEWS_API_URL, {
+            **NEWS_BASE_PARAMS,
+            'q': query,
+            'apiKey': self.news_api_key,
+            'from': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        }
+    
+    def _parse_news_sentiment(self, data: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """Score a News API response with simple keyword sentiment"""
+        articles = data.get('articles', [])
+        
+        # All article text in one Arrow buffer, so each keyword is a single scan across every article
+        texts = pc.utf8_lower(pa.array(
+            [f"{article.get('title', '')} {article.get('description', '')}" for article in articles],
+            type=pa.string()
+        ))
+        
+        # Each keyword counts once per article, however often it appears
+        positive_counts = sum(self._keyword_hits(texts, word) for word in POSITIVE_KEYWORDS)
+        negative_counts = sum(self._keyword_hits(texts, word) for word in NEGATIVE_KEYWORDS)
+        sentiment_scores = np.sign(positive_counts - negative_counts)
+        
+        avg_sentiment = float(sentiment_scores.mean()) if len(sentiment_scores) else 0
+        
+        return {
+            'query': query,
+            'sentiment_score': round(avg_sentiment, 2),
+            'sentiment_label': 'positive' if avg_sentiment > 0 else 'negative' if avg_sentiment < 0 else 'neutral',
+            'articles_analyzed': len(articles),
+            'timestamp': _now_iso()
+        }
+    
+    @staticmethod
+    def _keyword_hits(texts: pa.StringArray, word: str) -> np.ndarray:
+        """1 for each text containing the keyword, else 0"""
+        return pc.match_substring(texts, word).to_numpy(zero_copy_only=False).astype(int)
     
     def _fetch_news_sentiment(self, query: str) -> Dict[str, Any]:
         """Fetch news sentiment from News API"""
-        self.respect_rate_limit('news')
-        
-        try:
-            url = "https://newsapi.org/v2/everything"
-            params = {
-                'q': query,
-                'apiKey': self.news_api_key,
-                'language': 'en',
-                'sortBy': 'publishedAt',
-                'pageSize': 10,
-                'from': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-            }
-            
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            articles = data.get('articles', [])
-            
-            # Simple sentiment analysis based on keywords
-            positive_keywords = ['growth', 'increase', 'positive', 'success', 'profit', 'gain']
-            negative_keywords = ['decline', 'decrease', 'negative', 'loss', 'drop', 'fall']
-            
-            sentiment_scores = []
-            for article in articles:
-                title = article.get('title', '').lower()
-                description = article.get('description', '').lower()
-                text = f"{title} {description}"
-                
-                positive_count = sum(1 for word in positive_keywords if word in text)
-                negative_count = sum(1 for word in negative_keywords if word in text)
-                
-                if positive_count > negative_count:
-                    sentiment_scores.append(1)
-                elif negative_count > positive_count:
-                    sentiment_scores.append(-1)
-                else:
-                    sentiment_scores.append(0)
-            
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-            
-            return {
-                'query': query,
-                'sentiment_score': round(avg_sentiment, 2),
-                'sentiment_label': 'positive' if avg_sentiment > 0 else 'negative' if avg_sentiment < 0 else 'neutral',
-                'articles_analyzed': len(articles),
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            print(f"Error fetching news sentiment: {e}")
-            return self._get_mock_news_sentiment()
+        url, params = self._news_request(query)
+        return self._parse_news_sentiment(self._get_json('news', url, params), query)
+    
+    async def _fetch_news_sentiment_async(self, session: aiohttp.ClientSession, query: str) -> Dict[str, Any]:
+        """Fetch news sentiment from News API on an aiohttp session"""
+        url, params = self._news_request(query)
+        return self._parse_news_sentiment(await self._get_json_async(session, 'news', url, params), query)
     
     def _get_mock_news_sentiment(self) -> Dict[str, Any]:
         """Generate mock news sentiment"""
-        import random
-        sentiment_score = round(random.uniform(-1, 1), 2)
+        sentiment_score = round(self._rng.uniform(-1, 1), 2)
         return {
             'query': 'retail shopping',
             'sentiment_score': sentiment_score,
             'sentiment_label': 'positive' if sentiment_score > 0 else 'negative' if sentiment_score < 0 else 'neutral',
-            'articles_analyzed': random.randint(5, 15),
-            'timestamp': datetime.now().isoformat()
+            'articles_analyzed': self._rng.randint(5, 15),
+            'timestamp': _now_iso()
         }
     
     def get_economic_indicators(self) -> Dict[str, Any]:
         """Get economic indicators (mock data for demo)"""
-        import random
         return {
-            'inflation_rate': round(random.uniform(2, 6), 2),
-            'unemployment_rate': round(random.uniform(3, 8), 2),
-            'consumer_confidence': round(random.uniform(80, 120), 1),
-            'gdp_growth': round(random.uniform(-2, 4), 2),
-            'interest_rate': round(random.uniform(0, 5), 2),
-            'timestamp': datetime.now().isoformat()
+            'inflation_rate': round(self._rng.uniform(2, 6), 2),
+            'unemployment_rate': round(self._rng.uniform(3, 8), 2),
+            'consumer_confidence': round(self._rng.uniform(80, 120), 1),
+            'gdp_growth': round(self._rng.uniform(-2, 4), 2),
+            'interest_rate': round(self._rng.uniform(0, 5), 2),
+            'timestamp': _now_iso()
         }
     
     def get_geographic_data(self, city: str) -> Dict[str, Any]:
         """Get geographic and demographic data"""
-        # Mock geographic data
-        city_data = {
-            'New York': {'population': 8400000, 'median_income': 65000, 'timezone': 'EST'},
-            'Los Angeles': {'population': 4000000, 'median_income': 62000, 'timezone': 'PST'},
-            'Chicago': {'population': 2700000, 'median_income': 58000, 'timezone': 'CST'},
-            'Houston': {'population': 2300000, 'median_income': 55000, 'timezone': 'CST'},
-        }
-        
-        default_data = {'population': 1000000, 'median_income': 60000, 'timezone': 'EST'}
-        data = city_data.get(city, default_data)
-        
         return {
             'city': city,
-            'population': data['population'],
-            'median_income': data['median_income'],
-            'timezone': data['timezone'],
-            'timestamp': datetime.now().isoformat()
+            **CITY_DATA.get(city, DEFAULT_CITY_DATA),
+            'timestamp': _now_iso()
         }
     
     def enrich_interaction(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich customer interaction with external data"""
-        enriched = interaction.copy()
-        
         # Get customer's city from interaction or use default
         customer_city = interaction.get('city', 'New York')
         
-        # Add weather data
-        weather_data = self.get_weather_data(customer_city)
-        enriched.update({
-            'weather_temperature': weather_data['temperature'],
-            'weather_condition': weather_data['weather_condition'],
-            'weather_humidity': weather_data['humidity']
-        })
+        return self._combine_enrichment(
+            interaction,
+            weather_data=self.get_weather_data(customer_city),
+            stock_data=self.get_stock_market_data(),
+            news_sentiment=self.get_news_sentiment(),
+            economic_data=self.get_economic_indicators(),
+            geo_data=self.get_geographic_data(customer_city)
+        )
+    
+    async def enrich_interaction_async(self, session: aiohttp.ClientSession, interaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Enrich customer interaction with external data, fetching the APIs concurrently"""
+        customer_city = interaction.get('city', 'New York')
         
-        # Add market sentiment
-        stock_data = self.get_stock_market_data()
-        enriched.update({
-            'market_sentiment': stock_data['market_sentiment'],
-            'market_change_percent': stock_data['change_percent']
-        })
+        weather_data, stock_data, news_sentiment = await asyncio.gather(
+            self.get_weather_data_async(session, customer_city),
+            self.get_stock_market_data_async(session),
+            self.get_news_sentiment_async(session)
+        )
         
-        # Add news sentiment
-        news_sentiment = self.get_news_sentiment()
-        enriched.update({
-            'news_sentiment': news_sentiment['sentiment_label'],
-            'news_sentiment_score': news_sentiment['sentiment_score']
-        })
+        return self._combine_enrichment(
+            interaction,
+            weather_data=weather_data,
+            stock_data=stock_data,
+            news_sentiment=news_sentiment,
+            economic_data=self.get_economic_indicators(),
+            geo_data=self.get_geographic_data(customer_city)
+        )
+    
+    async def enrich_batch(self, interactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich many interactions at once over one pooled aiohttp session"""
+        session = self.get_async_session()
+        return list(await asyncio.gather(
+            *(self.enrich_interaction_async(session, interaction) for interaction in interactions)
+        ))
+    
+    def enrich_interactions(self, interactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Blocking wrapper around enrich_batch for code that isn't running an event loop"""
+        return self._run_async(self.enrich_batch(interactions))
+    
+    async def enrich_dataframe_async(self, interactions: pd.DataFrame) -> pd.DataFrame:
+        """Enrich a DataFrame of interactions, fetching each city's data once and assigning it column-wise"""
+        if 'city' in interactions.columns:
+            # Plain objects, since a categorical city column can't take a fill value outside its categories
+            cities = interactions['city'].astype(object).fillna('New York')
+        else:
+            cities = pd.Series('New York', index=interactions.index)
+        unique_cities = cities.unique()
+        
+        if self.weather_api_key or self.alpha_vantage_key or self.news_api_key:
+            external_data = await self._fetch_dataframe_enrichment(cities, unique_cities)
+        else:
+            # Nothing to fetch, so draw every row's mock data in one go
+            external_data = self.generate_mock_batch(len(interactions))
+        
+        geo_data = [CITY_DATA.get(city, DEFAULT_CITY_DATA) for city in unique_cities]
+        city_features = pd.DataFrame({
+            'city_population': [geo['population'] for geo in geo_data],
+            'city_median_income': [geo['median_income'] for geo in geo_data]
+        }, index=unique_cities).reindex(cities.to_numpy())
+        
+        enriched = interactions.copy()
+        for column in external_data.columns:
+            enriched[column] = external_data[column].to_numpy()
+        for column in city_features.columns:
+            enriched[column] = city_features[column].to_numpy()
         
-        # Add economic indicators
+        return enriched
+    
+    async def _fetch_dataframe_enrichment(self, cities: pd.Series, unique_cities: np.ndarray) -> pd.DataFrame:
+        """Weather per unique city expanded to one row per interaction, plus broadcast market, news and economic columns"""
+        session = self.get_async_session()
+        weather_data, stock_data, news_sentiment = await asyncio.gather(
+            asyncio.gather(*(self.get_weather_data_async(session, city) for city in unique_cities)),
+            self.get_stock_market_data_async(session),
+            self.get_news_sentiment_async(session)
+        )
         economic_data = self.get_economic_indicators()
-        enriched.update({
-            'inflation_rate': economic_data['inflation_rate'],
-            'consumer_confidence': economic_data['consumer_confidence']
-        })
         
-        # Add geographic data
-        geo_data = self.get_geographic_data(customer_city)
-        enriched.update({
+        external_data = pd.DataFrame({
+            'weather_temperature': [weather['temperature'] for weather in weather_data],
+            'weather_condition': [weather['weather_condition'] for weather in weather_data],
+            'weather_humidity': [weather['humidity'] for weather in weather_data]
+        }, index=unique_cities).reindex(cities.to_numpy())
+        
+        external_data['market_sentiment'] = stock_data['market_sentiment']
+        external_data['market_change_percent'] = stock_data['change_percent']
+        external_data['news_sentiment'] = news_sentiment['sentiment_label']
+        external_data['news_sentiment_score'] = news_sentiment['sentiment_score']
+        external_data['inflation_rate'] = economic_data['inflation_rate']
+        external_data['consumer_confidence'] = economic_data['consumer_confidence']
+        
+        return external_data
+    
+    def generate_mock_batch(self, n: int) -> pd.DataFrame:
+        """Draw n rows of mock enrichment columns at once, with the same ranges as the single-call mocks"""
+        rng = self.batch_rng
+        change = rng.uniform(-5, 5, n).round(2)
+        sentiment_score = rng.uniform(-1, 1, n).round(2)
+        
+        return pd.DataFrame({
+            'weather_temperature': rng.uniform(15, 30, n).round(1),
+            'weather_condition': rng.choice(['Clear', 'Clouds', 'Rain', 'Snow'], n),
+            'weather_humidity': rng.integers(40, 80, n, endpoint=True),
+            'market_sentiment': np.where(change > 0, 'positive', 'negative'),
+            'market_change_percent': np.char.mod('%.2f', change / 420 * 100),
+            'news_sentiment': np.select([sentiment_score > 0, sentiment_score < 0], ['positive', 'negative'], 'neutral'),
+            'news_sentiment_score': sentiment_score,
+            'inflation_rate': rng.uniform(2, 6, n).round(2),
+            'consumer_confidence': rng.uniform(80, 120, n).round(1)
+        })
+    
+    def enrich_dataframe(self, interactions: pd.DataFrame) -> pd.DataFrame:
+        """Blocking wrapper around enrich_dataframe_async"""
+        return self._run_async(self.enrich_dataframe_async(interactions))
+    
+    def _combine_enrichment(self, interaction: Dict[str, Any], weather_data: Dict[str, Any],
+                            stock_data: Dict[str, Any], news_sentiment: Dict[str, Any],
+                            economic_data: Dict[str, Any], geo_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy an interaction and add the external data fields to it"""
+        return {
+            **interaction,
+            # Weather data
+            'weather_temperature': weather_data['temperature'],
+            'weather_condition': weather_data['weather_condition'],
+            'weather_humidity': weather_data['humidity'],
+            # Market sentiment
+            'market_sentiment': stock_data['market_sentiment'],
+            'market_change_percent': stock_data['change_percent'],
+            # News sentiment
+            'news_sentiment': news_sentiment['sentiment_label'],
+            'news_sentiment_score': news_sentiment['sentiment_score'],
+            # Economic indicators
+            'inflation_rate': economic_data['inflation_rate'],
+            'consumer_confidence': economic_data['consumer_confidence'],
+            # Geographic data
             'city_population': geo_data['population'],
             'city_median_income': geo_data['median_income']
-        })
-        
-        return enriched
+        }
+
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+def get_api_manager() -> ExternalAPIManager:
+    """Process-wide ExternalAPIManager, so every caller shares one cache, set of rate limits and connection pool"""
+    global _shared_manager
+    with _shared_manager_lock:
+        if _shared_manager is None:
+            _shared_manager = ExternalAPIManager()
+        return _shared_manager
 
 if __name__ == "__main__":
     # Test the API manager
-    api_manager = ExternalAPIManager()
+    api_manager = get_api_manager()
     
     print("=== Testing External API Integrations ===\n")
     
     # Test weather data
     print("🌤️ Weather Data:")
     weather = api_manager.get_weather_data("New York")
-    print(json.dumps(weather, indent=2))
+    print(orjson.dumps(weather, option=orjson.OPT_INDENT_2).decode())
     
     print("\n📈 Stock Market Data:")
     stocks = api_manager.get_stock_market_data("SPY")
-    print(json.dumps(stocks, indent=2))
+    print(orjson.dumps(stocks, option=orjson.OPT_INDENT_2).decode())
     
     print("\n📰 News Sentiment:")
     news = api_manager.get_news_sentiment("retail shopping")
-    print(json.dumps(news, indent=2))
+    print(orjson.dumps(news, option=orjson.OPT_INDENT_2).decode())
     
     print("\n💰 Economic Indicators:")
     economic = api_manager.get_economic_indicators()
-    print(json.dumps(economic, indent=2))
+    print(orjson.dumps(economic, option=orjson.OPT_INDENT_2).decode())
     
     # Test interaction enrichment
     print("\n🔗 Enriched Interaction:")
@@ -357,4 +705,4 @@ if __name__ == "__main__":
     }
     
     enriched = api_manager.enrich_interaction(sample_interaction)
-    print(json.dumps(enriched, indent=2))
\ No newline at end of file
+    print(orjson.dumps(enriched, option=orjson.OPT_INDENT_2).decode())
\ No newline at end of file
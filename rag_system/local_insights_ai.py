@@ -1,6 +1,10 @@
 import os
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import json
+import pickle
 from typing import Dict, Any
 import sys
 
@@ -14,6 +18,34 @@ try:
 except:
     project_root = os.getcwd()
 
+# Pickled summary of the processed data, reused while the files it was built from are unchanged
+SUMMARY_CACHE_FILE = ".summary_cache.pkl"
+
+# Part of the summary cache key - bump whenever the loaded columns, dtypes or summary logic change
+SUMMARY_CACHE_VERSION = 2
+
+# Columns the summary and analyses read from each dataset; nothing else is loaded
+SUMMARY_COLUMNS = {
+    'touchpoint_analysis': ['touchpoint', 'total_interactions', 'total_revenue',
+                            'avg_revenue_per_interaction', 'conversion_rate'],
+    'customer_segments': ['customer_segment', 'total_revenue', 'total_interactions', 'unique_touchpoints_used'],
+    'customer_journeys': ['customer_id', 'total_interactions', 'total_revenue', 'journey_duration_days',
+                          'first_touchpoint', 'last_touchpoint', 'conversion_occurred'],
+    'time_series': ['date', 'daily_revenue', 'daily_interactions']
+}
+
+# Compact dtypes for the loaded frames: categorical labels and 32-bit counts and rates.
+# Revenue stays float64 since it is summed into the dollar totals we report.
+SUMMARY_DTYPES = {
+    'touchpoint_analysis': {'touchpoint': 'category', 'total_interactions': 'int32',
+                            'avg_revenue_per_interaction': 'float32', 'conversion_rate': 'float32'},
+    'customer_segments': {'customer_segment': 'category', 'total_interactions': 'int32',
+                          'unique_touchpoints_used': 'int32'},
+    'customer_journeys': {'total_interactions': 'int32', 'journey_duration_days': 'int32',
+                          'first_touchpoint': 'category', 'last_touchpoint': 'category'},
+    'time_series': {'daily_interactions': 'int32'}
+}
+
 class LocalCustomerInsightsAI:
     def __init__(self):
         # Load customer data with flexible path handling
@@ -22,7 +54,7 @@ class LocalCustomerInsightsAI:
         self.create_insight_templates()
     
     def load_customer_data(self):
-        """Load processed customer data from CSV files"""
+        """Load processed customer data from Parquet files"""
         # Try multiple possible data paths
         possible_paths = [
             "data/processed/",
@@ -32,11 +64,13 @@ class LocalCustomerInsightsAI:
         ]
         
         self.data = {}
+        self.data_path = None
+        self.source_files = []
         files_to_load = {
-            'touchpoint_analysis': 'touchpoint_analysis_clean.csv',
-            'customer_segments': 'customer_segments_clean.csv', 
-            'customer_journeys': 'customer_journeys_clean.csv',
-            'time_series': 'time_series_data_clean.csv'
+            'touchpoint_analysis': 'touchpoint_analysis_clean.parquet',
+            'customer_segments': 'customer_segments_clean.parquet', 
+            'customer_journeys': 'customer_journeys_clean.parquet',
+            'time_series': 'time_series_data_clean.parquet'
         }
         
         data_path = None
@@ -50,28 +84,47 @@ class LocalCustomerInsightsAI:
             self._create_mock_data()
             return
         
+        self.data_path = data_path
         for key, filename in files_to_load.items():
-            filepath = os.path.join(data_path, filename)
-            if os.path.exists(filepath):
+            try:
+                self.data[key] = self._read_processed_file(data_path, filename, SUMMARY_COLUMNS[key], SUMMARY_DTYPES[key])
+            except Exception as e:
+                print(f"⚠️ Error loading {filename}: {e}")
+                # Try without _clean suffix
+                alt_filename = filename.replace('_clean', '')
                 try:
-                    self.data[key] = pd.read_csv(filepath)
-                    print(f"✅ Loaded {key}: {len(self.data[key])} rows")
-                except Exception as e:
-                    print(f"⚠️ Error loading {filename}: {e}")
-                    # Try without _clean suffix
-                    alt_filepath = os.path.join(data_path, filename.replace('_clean', ''))
-                    if os.path.exists(alt_filepath):
-                        try:
-                            self.data[key] = pd.read_csv(alt_filepath)
-                            print(f"✅ Loaded {key}: {len(self.data[key])} rows")
-                        except Exception as e2:
-                            print(f"⚠️ Error loading {alt_filepath}: {e2}")
-                            self.data[key] = pd.DataFrame()
-                    else:
-                        self.data[key] = pd.DataFrame()
-            else:
-                print(f"⚠️ Warning: {filepath} not found")
-                self.data[key] = pd.DataFrame()
+                    self.data[key] = self._read_processed_file(data_path, alt_filename, SUMMARY_COLUMNS[key], SUMMARY_DTYPES[key])
+                except Exception as e2:
+                    print(f"⚠️ Error loading {alt_filename}: {e2}")
+                    self.data[key] = pd.DataFrame()
+                    continue
+            print(f"✅ Loaded {key}: {len(self.data[key])} rows")
+    
+    def _read_processed_file(self, data_path: str, filename: str, columns: list, dtypes: dict) -> pd.DataFrame:
+        """Read a processed Parquet file, converting it once from the CSV an older pipeline run left behind"""
+        filepath = os.path.join(data_path, filename)
+        csv_filepath = filepath.replace('.parquet', '.csv')
+        if not os.path.exists(filepath) and os.path.exists(csv_filepath):
+            # Multithreaded Arrow CSV reader, written straight to Parquet without a pandas round trip
+            pq.write_table(pacsv.read_csv(csv_filepath), filepath, compression='snappy')
+            print(f"🔄 Converted {csv_filepath} to Parquet")
+        
+        # Only read the column chunks we use; files from older runs may lack some optional columns
+        available = set(pq.read_schema(filepath).names)
+        df = pd.read_parquet(filepath, columns=[col for col in columns if col in available])
+        df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        self.source_files.append(filepath)
+        return df
+    
+    def get_data_key(self) -> str:
+        """Fingerprint the summary version and loaded files by size and modification time, or None for mock data"""
+        if not self.source_files:
+            return None
+        parts = [f"v{SUMMARY_CACHE_VERSION}"]
+        for path in self.source_files:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
     
     def _create_mock_data(self):
         """Create mock data when real data is not available"""
@@ -134,31 +187,59 @@ class LocalCustomerInsightsAI:
     
     def create_data_summary(self):
         """Create a comprehensive data summary"""
+        # Formatted answers are built from the summary, so start them afresh
+        self._analysis_cache = {}
+        
+        data_key = self.get_data_key()
+        cache_path = os.path.join(self.data_path, SUMMARY_CACHE_FILE) if data_key else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    cached = pickle.load(cache_file)
+                if isinstance(cached, dict) and cached.get('key') == data_key:
+                    self.summary = cached['summary']
+                    print("✅ Data summary loaded from cache")
+                    return
+            except Exception as e:
+                # Truncated files, pickles from other pandas versions and the like are rebuilt below
+                print(f"⚠️ Ignoring unreadable summary cache: {e}")
+        
         summary = {}
         
         # Touchpoint Analysis Summary
         if not self.data['touchpoint_analysis'].empty:
             tp_data = self.data['touchpoint_analysis']
+            best_revenue, best_conversion, most_interactions = tp_data[
+                ['total_revenue', 'conversion_rate', 'total_interactions']
+            ].idxmax()
             summary['touchpoints'] = {
-                'best_revenue': tp_data.loc[tp_data['total_revenue'].idxmax()],
-                'best_conversion': tp_data.loc[tp_data['conversion_rate'].idxmax()],
-                'most_interactions': tp_data.loc[tp_data['total_interactions'].idxmax()],
+                'best_revenue': tp_data.loc[best_revenue],
+                'best_conversion': tp_data.loc[best_conversion],
+                'most_interactions': tp_data.loc[most_interactions],
                 'all_data': tp_data
             }
         
         # Customer Segments Summary
         if not self.data['customer_segments'].empty:
             seg_data = self.data['customer_segments']
-            segment_summary = seg_data.groupby('customer_segment').agg({
+            segment_summary = seg_data.groupby('customer_segment', observed=True).agg({
                 'total_revenue': ['count', 'mean', 'sum'],
                 'total_interactions': 'mean',
                 'unique_touchpoints_used': 'mean'
             }).round(2)
             
+            best_segment = most_customers = None
+            if not segment_summary.empty:
+                best_idx, most_customers_idx = segment_summary[
+                    [('total_revenue', 'sum'), ('total_revenue', 'count')]
+                ].idxmax()
+                best_segment = segment_summary.loc[best_idx]
+                most_customers = segment_summary.loc[most_customers_idx]
+            
             summary['segments'] = {
                 'summary_table': segment_summary,
-                'best_segment': segment_summary.loc[segment_summary[('total_revenue', 'sum')].idxmax()] if not segment_summary.empty else None,
-                'most_customers': segment_summary.loc[segment_summary[('total_revenue', 'count')].idxmax()] if not segment_summary.empty else None
+                'best_segment': best_segment,
+                'most_customers': most_customers
             }
         
         # Journey Analysis Summary
@@ -176,15 +257,27 @@ class LocalCustomerInsightsAI:
         # Time Series Summary
         if not self.data['time_series'].empty:
             ts_data = self.data['time_series']
+            revenue_stats = ts_data['daily_revenue'].agg(['sum', 'mean', 'argmax'])
+            # Exponentially smoothed revenue damps single-day spikes at either end of the window
+            smoothed_revenue = ts_data['daily_revenue'].ewm(span=30).mean().to_numpy()
+            # Least-squares slope over every day, not just the two ends of the window
+            revenue_slope = np.polyfit(np.arange(len(smoothed_revenue)), smoothed_revenue, 1)[0] if len(smoothed_revenue) > 1 else 0.0
             summary['time_trends'] = {
-                'total_revenue': ts_data['daily_revenue'].sum(),
-                'avg_daily_revenue': ts_data['daily_revenue'].mean(),
-                'peak_day': ts_data.loc[ts_data['daily_revenue'].idxmax()],
-                'trend': 'increasing' if ts_data['daily_revenue'].iloc[-5:].mean() > ts_data['daily_revenue'].iloc[:5].mean() else 'decreasing'
+                'total_revenue': revenue_stats['sum'],
+                'avg_daily_revenue': revenue_stats['mean'],
+                'peak_day': ts_data.iloc[int(revenue_stats['argmax'])],
+                'trend': 'increasing' if revenue_slope > 0 else 'decreasing'
             }
         
         self.summary = summary
         print("✅ Data summary created")
+        
+        if cache_path:
+            try:
+                with open(cache_path, 'wb') as cache_file:
+                    pickle.dump({'key': data_key, 'summary': summary}, cache_file)
+            except (OSError, pickle.PicklingError) as e:
+                print(f"⚠️ Could not cache data summary: {e}")
     
     def create_insight_templates(self):
         """Create templates for different types of insights"""
@@ -196,6 +289,12 @@ class LocalCustomerInsightsAI:
             'revenue_trends': self._analyze_revenue_trends
         }
     
+    def get_analysis(self, name: str) -> str:
+        """Formatted analysis for one template, generated once per summary"""
+        if name not in self._analysis_cache:
+            self._analysis_cache[name] = self.templates[name]()
+        return self._analysis_cache[name]
+    
     def _analyze_touchpoint_performance(self):
         """Analyze touchpoint performance"""
         if 'touchpoints' not in self.summary:
@@ -336,23 +435,23 @@ class LocalCustomerInsightsAI:
         
         # Simple keyword matching to determine question type
         if any(word in question_lower for word in ['touchpoint', 'channel', 'performance']):
-            answer = self._analyze_touchpoint_performance()
+            answer = self.get_analysis('touchpoint_performance')
         elif any(word in question_lower for word in ['segment', 'customer', 'valuable']):
-            answer = self._analyze_customer_segments()
+            answer = self.get_analysis('customer_segments')
         elif any(word in question_lower for word in ['journey', 'path', 'conversion']):
-            answer = self._analyze_journey_patterns()
+            answer = self.get_analysis('journey_patterns')
         elif any(word in question_lower for word in ['trend', 'revenue', 'time']):
-            answer = self._analyze_revenue_trends()
+            answer = self.get_analysis('revenue_trends')
         elif any(word in question_lower for word in ['recommend', 'improve', 'strategy']):
-            answer = self._generate_recommendations()
+            answer = self.get_analysis('recommendations')
         else:
             # Default comprehensive answer
             answer = f"""
-            {self._analyze_touchpoint_performance()}
+            {self.get_analysis('touchpoint_performance')}
             
-            {self._analyze_customer_segments()}
+            {self.get_analysis('customer_segments')}
             
-            {self._analyze_journey_patterns()}
+            {self.get_analysis('journey_patterns')}
             """
         
         return {
@@ -365,11 +464,11 @@ class LocalCustomerInsightsAI:
         """Generate a comprehensive insights summary"""
         summary = "# 🎯 Customer Behavior Insights Dashboard\n\n"
         
-        summary += self._analyze_touchpoint_performance() + "\n\n"
-        summary += self._analyze_customer_segments() + "\n\n" 
-        summary += self._analyze_journey_patterns() + "\n\n"
-        summary += self._analyze_revenue_trends() + "\n\n"
-        summary += self._generate_recommendations() + "\n\n"
+        summary += self.get_analysis('touchpoint_performance') + "\n\n"
+        summary += self.get_analysis('customer_segments') + "\n\n" 
+        summary += self.get_analysis('journey_patterns') + "\n\n"
+        summary += self.get_analysis('revenue_trends') + "\n\n"
+        summary += self.get_analysis('recommendations') + "\n\n"
         
         return summary
 
@@ -1,14 +1,29 @@
 import pandas as pd
+import pyarrow as pa
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
+from google.cloud.bigquery_storage_v1 import types as storage_types, writer as storage_writer
 import os
 from dotenv import load_dotenv
-import time
 from datetime import datetime
 import threading
 import queue
 
 load_dotenv()
 
+# Arrow layout of realtime_interactions rows, as sent to the Storage Write API
+REALTIME_ARROW_SCHEMA = pa.schema([
+    pa.field("interaction_id", pa.string(), nullable=False),
+    pa.field("customer_id", pa.string(), nullable=False),
+    pa.field("touchpoint", pa.string()),
+    pa.field("timestamp", pa.timestamp('us', tz='UTC')),
+    pa.field("revenue", pa.float64()),
+    pa.field("action_taken", pa.string()),
+    pa.field("customer_segment", pa.string()),
+    pa.field("processed_timestamp", pa.timestamp('us', tz='UTC')),
+])
+TIMESTAMP_COLUMNS = ['timestamp', 'processed_timestamp']
+
 class BigQueryStreaming:
     def __init__(self):
         self.project_id = os.getenv('GCP_PROJECT_ID')
@@ -19,6 +34,7 @@ class BigQueryStreaming:
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.credentials_path
         
         self.client = bigquery.Client(project=self.project_id)
+        self.write_client = bigquery_storage.BigQueryWriteClient()
         self.streaming_queue = queue.Queue()
         self.is_streaming = False
         
@@ -73,38 +89,63 @@ class BigQueryStreaming:
         
         self.streaming_queue.put(bq_interaction)
     
+    def open_append_stream(self) -> storage_writer.AppendRowsStream:
+        """Arrow append stream on the table's _default write stream, where rows commit as soon as they're acknowledged"""
+        table_path = self.write_client.table_path(self.project_id, self.dataset_id, 'realtime_interactions')
+        request_template = storage_types.AppendRowsRequest(write_stream=f"{table_path}/streams/_default")
+        request_template.arrow_rows.writer_schema.serialized_schema = REALTIME_ARROW_SCHEMA.serialize().to_pybytes()
+        return storage_writer.AppendRowsStream(self.write_client, request_template)
+    
+    def to_record_batch(self, rows) -> pa.RecordBatch:
+        """Convert queued interaction dicts to an Arrow batch; naive timestamps are taken as UTC, as streaming inserts did"""
+        df = pd.DataFrame(rows, columns=REALTIME_ARROW_SCHEMA.names)
+        for column in TIMESTAMP_COLUMNS:
+            df[column] = pd.to_datetime(df[column], utc=True, format='ISO8601')
+        return pa.RecordBatch.from_pandas(df, schema=REALTIME_ARROW_SCHEMA, preserve_index=False)
+    
     def start_streaming_to_bigquery(self, batch_size=100, interval_seconds=30):
         """Start streaming data to BigQuery in batches"""
         self.is_streaming = True
         
         def stream_worker():
-            table_id = f"{self.project_id}.{self.dataset_id}.realtime_interactions"
+            # One long-lived gRPC append stream instead of a JSON POST per batch
+            append_rows_stream = None
             
             while self.is_streaming:
-                batch = []
+                # Collect batch: block until something arrives, then take whatever else is already queued
+                try:
+                    batch = [self.streaming_queue.get(timeout=interval_seconds)]
+                except queue.Empty:
+                    continue
                 
-                # Collect batch
-                for _ in range(batch_size):
-                    if not self.streaming_queue.empty():
-                        batch.append(self.streaming_queue.get())
-                    else:
-                        break
-                
-                # Stream to BigQuery if we have data
-                if batch:
+                while len(batch) < batch_size:
                     try:
-                        errors = self.client.insert_rows_json(
-                            self.client.get_table(table_id), 
-                            batch
-                        )
-                        if not errors:
-                            print(f"✅ Streamed {len(batch)} interactions to BigQuery")
-                        else:
-                            print(f"❌ Errors streaming to BigQuery: {errors}")
-                    except Exception as e:
-                        print(f"❌ Error streaming to BigQuery: {e}")
+                        batch.append(self.streaming_queue.get_nowait())
+                    except queue.Empty:
+                        break
                 
-                time.sleep(interval_seconds)
+                # Stream to BigQuery
+                try:
+                    if append_rows_stream is None:
+                        append_rows_stream = self.open_append_stream()
+                    
+                    request = storage_types.AppendRowsRequest()
+                    request.arrow_rows.rows.serialized_record_batch = self.to_record_batch(batch).serialize().to_pybytes()
+                    response = append_rows_stream.send(request).result()
+                    
+                    if not response.row_errors:
+                        print(f"✅ Streamed {len(batch)} interactions to BigQuery")
+                    else:
+                        print(f"❌ Errors streaming to BigQuery: {list(response.row_errors)}")
+                except Exception as e:
+                    print(f"❌ Error streaming to BigQuery: {e}")
+                    # Start a fresh append stream for the next batch
+                    if append_rows_stream is not None:
+                        append_rows_stream.close()
+                        append_rows_stream = None
+            
+            if append_rows_stream is not None:
+                append_rows_stream.close()
         
         # Start background thread
         self.thread = threading.Thread(target=stream_worker, daemon=True)
@@ -15,7 +15,7 @@ sys.path.append(project_root)
 
 from real_time.streaming_simulator import RealTimeCustomerSimulator
 from real_time.streaming_processor import EnhancedRealTimeDataProcessor
-from external_apis.api_manager import ExternalAPIManager
+from external_apis.api_manager import get_api_manager
 
 st.set_page_config(
     page_title="Enhanced Real-Time Analytics",
@@ -28,7 +28,7 @@ st.set_page_config(
 if 'enhanced_simulator' not in st.session_state:
     st.session_state.enhanced_simulator = RealTimeCustomerSimulator()
     st.session_state.enhanced_processor = EnhancedRealTimeDataProcessor()
-    st.session_state.api_manager = ExternalAPIManager()
+    st.session_state.api_manager = get_api_manager()
     st.session_state.is_enhanced_streaming = False
 
 def start_enhanced_streaming():
@@ -414,10 +414,11 @@ def main():
         with col2:
             st.markdown("**API Cache Status**")
             cache_info = {}
-            for key in st.session_state.api_manager.cache:
+            for key, data in st.session_state.api_manager.cache_snapshot().items():
+                cached_at = datetime.fromisoformat(data['timestamp'])
                 cache_info[key] = {
-                    'cached_at': datetime.fromtimestamp(st.session_state.api_manager.cache[key]['timestamp']).strftime('%H:%M:%S'),
-                    'age_seconds': int(time.time() - st.session_state.api_manager.cache[key]['timestamp'])
+                    'cached_at': cached_at.strftime('%H:%M:%S'),
+                    'age_seconds': int((datetime.now() - cached_at).total_seconds())
                 }
             st.json(cache_info)
     
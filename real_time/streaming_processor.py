@@ -13,7 +13,10 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
-from external_apis.api_manager import ExternalAPIManager
+from external_apis.api_manager import get_api_manager
+
+# Most queued interactions enriched together - one batch fetches the APIs concurrently
+ENRICHMENT_BATCH_SIZE = 100
 
 class EnhancedRealTimeDataProcessor:
     def __init__(self, window_size_minutes=5):
@@ -23,8 +26,8 @@ class EnhancedRealTimeDataProcessor:
         self.metrics_cache = {}
         self.last_update = datetime.now()
         
-        # Initialize API manager
-        self.api_manager = ExternalAPIManager()
+        # Shared API manager, so enrichment reuses the dashboard's cached responses
+        self.api_manager = get_api_manager()
         
         # Enhanced real-time metrics
         self.current_metrics = {
@@ -49,18 +52,26 @@ class EnhancedRealTimeDataProcessor:
         """Start background thread for API enrichment"""
         def enrichment_worker():
             while True:
-                if self.enrichment_queue:
-                    interaction = self.enrichment_queue.popleft()
+                # Drain what queued up since the last pass and enrich it as one concurrent batch
+                batch = []
+                while self.enrichment_queue and len(batch) < ENRICHMENT_BATCH_SIZE:
+                    batch.append(self.enrichment_queue.popleft())
+                
+                if batch:
                     try:
-                        enriched = self.api_manager.enrich_interaction(interaction)
-                        self.enriched_interactions.append(enriched)
-                        self.update_external_metrics(enriched)
+                        enriched_batch = self.api_manager.enrich_interactions(batch)
                     except Exception as e:
-                        print(f"Error enriching interaction: {e}")
-                        # Add original interaction if enrichment fails
-                        self.enriched_interactions.append(interaction)
+                        print(f"Error enriching interactions: {e}")
+                        # Add original interactions if enrichment fails
+                        self.enriched_interactions.extend(batch)
+                    else:
+                        for enriched in enriched_batch:
+                            self.enriched_interactions.append(enriched)
+                            self.update_external_metrics(enriched)
                 
-                time.sleep(1)  # Process one interaction per second
+                # Only wait when caught up, so a backlog is worked through batch after batch
+                if len(batch) < ENRICHMENT_BATCH_SIZE:
+                    time.sleep(1)
         
         thread = threading.Thread(target=enrichment_worker, daemon=True)
         thread.start()
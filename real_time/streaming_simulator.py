@@ -11,9 +11,9 @@ from typing import Dict, List
 import os
 
 class RealTimeCustomerSimulator:
-    def __init__(self, customers_data_path="data/raw/customers_clean.csv"):
+    def __init__(self, customers_data_path="data/raw/customers_clean.parquet"):
         self.fake = Faker()
-        self.customers = pd.read_csv(customers_data_path) if os.path.exists(customers_data_path) else self.generate_customers()
+        self.customers = pd.read_parquet(customers_data_path) if os.path.exists(customers_data_path) else self.generate_customers()
         self.interaction_queue = queue.Queue()
         self.is_running = False
         
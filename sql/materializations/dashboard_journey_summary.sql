@@ -0,0 +1,10 @@
+-- First/last touchpoint rollup read by the dashboard's Journey Analysis page
+CREATE OR REPLACE TABLE `{project_id}.{dataset_id}.dashboard_journey_summary` AS
+SELECT 
+    first_touchpoint,
+    last_touchpoint,
+    COUNT(*) as journey_count,
+    AVG(total_revenue) as avg_revenue,
+    AVG(journey_duration_days) as avg_duration
+FROM `{project_id}.{dataset_id}.customer_journeys`
+GROUP BY first_touchpoint, last_touchpoint
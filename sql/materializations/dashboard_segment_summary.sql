@@ -0,0 +1,12 @@
+-- Per-segment rollup read by the dashboard's Overview and Customer Segments pages
+CREATE OR REPLACE TABLE `{project_id}.{dataset_id}.dashboard_segment_summary` AS
+SELECT 
+    customer_segment,
+    COUNT(*) as customer_count,
+    AVG(total_revenue) as avg_revenue,
+    AVG(total_interactions) as avg_interactions,
+    SUM(total_revenue) as total_revenue,
+    SUM(total_interactions) as total_interactions,
+    COUNT(total_revenue) as active_customers
+FROM `{project_id}.{dataset_id}.customer_segments`
+GROUP BY customer_segment
@@ -1,4 +1,5 @@
 import os
+import argparse
 import pandas as pd
 from dotenv import load_dotenv
 from data_warehouse.bigquery_manager import BigQueryManager
@@ -6,7 +7,12 @@ from data_warehouse.bigquery_manager import BigQueryManager
 load_dotenv()
 
 def main():
-    print("=== Uploading Data to BigQuery ===")
+    parser = argparse.ArgumentParser(description="Upload processed data to BigQuery")
+    parser.add_argument(
+        "--refresh-materializations", action="store_true",
+        help="Only rebuild the dashboard summary tables from the tables already in BigQuery"
+    )
+    args = parser.parse_args()
     
     # Initialize BigQuery manager
     bq_manager = BigQueryManager(
@@ -14,6 +20,17 @@ def main():
         credentials_path=os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
     )
     
+    if args.refresh_materializations:
+        print("=== Refreshing Dashboard Summary Tables ===")
+        try:
+            bq_manager.refresh_materializations()
+        except Exception as e:
+            print(f"❌ Refresh failed: {e}")
+            return False
+        return True
+    
+    print("=== Uploading Data to BigQuery ===")
+    
     # Ensure tables exist
     bq_manager.setup_all_tables()
     
@@ -24,21 +41,13 @@ def main():
         # Test with a simple query
         print("\n🧪 Testing data upload with sample queries...")
         
-        # Test customers table
-        query = f"""
-        SELECT COUNT(*) as customer_count
-        FROM `{bq_manager.project_id}.{bq_manager.dataset_id}.customers`
-        """
-        result = bq_manager.query_data(query)
-        print(f"✅ Customers table: {result.iloc[0]['customer_count']} rows")
-        
-        # Test interactions table
-        query = f"""
-        SELECT COUNT(*) as interaction_count
-        FROM `{bq_manager.project_id}.{bq_manager.dataset_id}.interactions`
-        """
-        result = bq_manager.query_data(query)
-        print(f"✅ Interactions table: {result.iloc[0]['interaction_count']} rows")
+        # Row counts come from dataset metadata, so no table is scanned
+        row_counts = bq_manager.get_table_row_counts()
+        for table in ['customers', 'interactions']:
+            if table in row_counts:
+                print(f"✅ {table.title()} table: {row_counts[table]} rows")
+            else:
+                print(f"❌ {table.title()} table: MISSING")
         
         # Test touchpoint analysis
         query = f"""